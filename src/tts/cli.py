@@ -1,245 +0,0 @@
-"""Click CLI for TTS Inference."""
-
-import os
-import sys
-import asyncio
-import logging
-from textwrap import dedent
-
-from tts.utils.logging import setup_logging
-from tts.utils.config import CONFIG
-
-# CUDA_VISIBLE_DEVICES must be set before any torch import. We respect a
-# value already in the environment (ad-hoc override); otherwise we apply
-# the config-defined GPU. This is why the tts.server import is deferred
-# below.
-if "CUDA_VISIBLE_DEVICES" not in os.environ:
-    os.environ["CUDA_VISIBLE_DEVICES"] = str(CONFIG.gpu_device)
-
-import uvicorn  # noqa: E402
-import click  # noqa: E402
-
-from tts.server import run_zmq_server  # noqa: E402
-from tts.services import TTSService, DatabaseService  # noqa: E402
-
-
-@click.group()
-@click.version_option(version="0.1.0")
-def main():
-    """TTS Inference - TTS streaming server."""
-    pass
-
-
-@main.group()
-def run():
-    """Run the server in different modes."""
-    pass
-
-
-@run.command()
-@click.option("--host", default=None, help="Host to bind to (default: from env or 0.0.0.0)")
-@click.option("--port", default=None, type=int, help="Port to bind to (default: from env or 20480)")
-@click.option("--log-level", default=None, help="Log level (default: from env or INFO)")
-@click.option("--reload", is_flag=True, help="Enable auto-reload for development")
-@click.option("--offload-timeout", default=None, type=int, help="Seconds of inactivity before offloading model (default: 600)")
-@click.option("--keep-warm", is_flag=True, help="Keep model loaded in memory (disable auto-offloading)")
-@click.option("--engine", default=None, type=click.Choice(["chatterbox", "omnivoice", "fish-speech"]), help="TTS engine to use (default: from TTS_ENGINE env or chatterbox)")
-def fastapi(host, port, log_level, reload, offload_timeout, keep_warm, engine):
-    """Run FastAPI HTTP/WebSocket server."""
-    _apply_config_overrides(log_level=log_level, host=host, port=port, offload_timeout=offload_timeout, keep_warm=keep_warm, engine=engine)
-    setup_logging(CONFIG.log_level)
-
-    logger = logging.getLogger(__name__)
-    logger.info("Starting TTS Inference in FastAPI mode")
-    logger.info(f"Host: {CONFIG.fastapi_host}, Port: {CONFIG.fastapi_port}")
-
-    _validate_api_key(logger)
-
-    uvicorn.run(
-        "tts.server.fastapi_server:app",
-        host=CONFIG.fastapi_host,
-        port=CONFIG.fastapi_port,
-        reload=reload,
-        log_level=CONFIG.log_level.lower(),
-    )
-
-
-@run.command()
-@click.option("--input-address", default=None, help="Input ROUTER address (overrides TTS_INPUT_ADDRESS)")
-@click.option("--pub-address", default=None, help="PUB broadcast address (overrides TTS_PUB_ADDRESS; pass '' to disable)")
-@click.option("--log-level", default=None, help="Log level (default: from env or INFO)")
-@click.option("--offload-timeout", default=None, type=int, help="Seconds of inactivity before offloading model (default: 600)")
-@click.option("--keep-warm", is_flag=True, help="Keep model loaded in memory")
-@click.option("--engine", default=None, type=click.Choice(["chatterbox", "omnivoice", "fish-speech"]), help="TTS engine to use (default: from TTS_ENGINE env or chatterbox)")
-def zmq(input_address, pub_address, log_level, offload_timeout, keep_warm, engine):
-    """Run ZMQ ROUTER server.
-
-    PUB broadcasting is on by default (TTS_PUB_ADDRESS defaults to tcp://*:20502).
-    All audio frames are broadcast to SUB subscribers; error and complete frames are
-    also ACKed back to the requesting DEALER so upstream callers can observe failures.
-    Set TTS_PUB_ADDRESS='' or pass --pub-address='' to disable PUB and route everything
-    back via ROUTER only.
-    """
-    _apply_config_overrides(log_level=log_level, offload_timeout=offload_timeout, keep_warm=keep_warm, engine=engine)
-    setup_logging(CONFIG.log_level)
-
-    logger = logging.getLogger(__name__)
-    logger.info("Starting TTS Inference in ZMQ mode")
-
-    zmq_input = input_address or CONFIG.zmq_input_address
-    zmq_pub = pub_address if pub_address is not None else CONFIG.zmq_pub_address
-
-    logger.info(f"Input address: {zmq_input}")
-    if zmq_pub:
-        logger.info(f"PUB address: {zmq_pub}")
-    else:
-        logger.info("PUB broadcasting disabled — responses routed via ROUTER only")
-
-    _validate_api_key(logger)
-
-    try:
-        asyncio.run(run_zmq_server(zmq_input, zmq_pub))
-    except KeyboardInterrupt:
-        logger.info("Received interrupt signal, shutting down")
-    except Exception as e:
-        logger.error(f"Server error: {e}", exc_info=True)
-        sys.exit(1)
-
-
-def _apply_config_overrides(log_level=None, host=None, port=None, offload_timeout=None, keep_warm=None, engine=None):
-    if log_level:
-        CONFIG.log_level = log_level
-    if host:
-        CONFIG.fastapi_host = host
-    if port:
-        CONFIG.fastapi_port = port
-    if offload_timeout is not None:
-        CONFIG.offload_timeout = offload_timeout
-    if keep_warm:
-        CONFIG.keep_warm = True
-    if engine:
-        CONFIG.tts_engine = engine
-
-
-def _validate_api_key(logger):
-    try:
-        CONFIG.validate_api_key()
-        logger.info("API key validation successful")
-    except ValueError as e:
-        logger.error(str(e))
-        click.echo(f"Error: {e}", err=True)
-        sys.exit(1)
-
-
-@main.group()
-def db():
-    """Database management commands."""
-    pass
-
-
-@db.command()
-@click.option("--log-level", default="INFO", help="Log level (DEBUG, INFO, WARNING, ERROR)")
-def migrate(log_level):
-    """Run database migrations."""
-    setup_logging(log_level)
-    logger = logging.getLogger(__name__)
-
-    click.echo(dedent(f"""\
-        Running database migrations...
-        Database: {CONFIG.database_path}
-    """))
-
-    try:
-        service = DatabaseService()
-        service.run_migrations()
-        click.echo("\n✓ Migrations complete!")
-    except Exception as e:
-        click.echo(f"✗ Migration failed: {e}", err=True)
-        logger.error("Migration error", exc_info=True)
-        sys.exit(1)
-
-
-@db.command()
-@click.option("--log-level", default="INFO", help="Log level (DEBUG, INFO, WARNING, ERROR)")
-def migration_status(log_level):
-    """Show database migration status."""
-    setup_logging(log_level)
-
-    try:
-        service = DatabaseService()
-        click.echo(service.get_migration_history_display())
-    except Exception as e:
-        click.echo(f"Error: {e}", err=True)
-        sys.exit(1)
-
-
-@main.command()
-def config_info():
-    """Display current configuration."""
-    click.echo(dedent(f"""\
-        TTS Inference Configuration
-        ========================================
-        Engine: {CONFIG.tts_engine}
-        Voice Directory: {CONFIG.voice_dir}
-        Voice Audio Directory: {CONFIG.voice_audio_dir}
-        Database Path: {CONFIG.database_path}
-        API Key Configured: {"Yes" if CONFIG.api_key else "No"}
-
-        FastAPI Settings:
-          Host: {CONFIG.fastapi_host}
-          Port: {CONFIG.fastapi_port}
-
-        ZMQ Settings:
-          Input Address: {CONFIG.zmq_input_address}
-          PUB Address: {CONFIG.zmq_pub_address if CONFIG.zmq_pub_address else "Not configured"}
-
-        Model Settings:
-          Offload Timeout: {CONFIG.offload_timeout}s
-          Keep Warm: {"Yes" if CONFIG.keep_warm else "No"}
-
-        Log Level: {CONFIG.log_level}
-        ========================================
-    """))
-
-
-@main.command()
-@click.option("--text", default="Hello world, this is a test of the text to speech system.", help="Text to synthesize")
-@click.option("--voice-id", required=True, help="Voice ID to use for synthesis")
-@click.option("--output-dir", default="./test_samples", help="Directory to save test files")
-def test_gen(text, voice_id, output_dir):
-    """Generate test audio files in all formats for debugging."""
-    setup_logging("INFO")
-    logger = logging.getLogger(__name__)
-
-    click.echo(dedent(f"""\
-        Generating test samples...
-        Text: {text}
-        Output directory: {output_dir}
-    """))
-
-    try:
-        results = asyncio.run(TTSService.generate_test_samples(
-            text=text,
-            voice_id=voice_id,
-            output_dir=output_dir,
-        ))
-
-        click.echo(dedent(f"""\
-            ✓ Generated {results.samples} samples at {results.sample_rate}Hz
-              Duration: {results.duration:.2f} seconds
-        """))
-
-        for _, info in results.files.items():
-            click.echo(f"✓ Saved {info.path} ({info.size:,} bytes)")
-
-        click.echo(dedent(f"""\
-
-            Done! Check the files with:
-              file {output_dir}/*
-              ffplay {output_dir}/test.wav
-        """))
-
-    except Exception as e:
-        click.echo(f"✗ Generation failed: {e}", err=True)
-        logger.error("Test generation error", exc_info=True)
-        sys.exit(1)
@@ -0,0 +1,36 @@
+"""Click CLI for TTS Inference.
+
+Subcommands live in ``tts.cli.commands`` and are imported only when Click
+resolves them, so invoking one command doesn't build the others.
+"""
+
+import os
+
+from tts.utils.config import CONFIG
+
+# CUDA_VISIBLE_DEVICES must be set before any torch import. We respect a
+# value already in the environment (ad-hoc override); otherwise we apply
+# the config-defined GPU. The server and service imports are deferred into
+# the commands that use them, so this always runs first and commands that
+# never touch the model don't pay for importing it.
+if "CUDA_VISIBLE_DEVICES" not in os.environ:
+    os.environ["CUDA_VISIBLE_DEVICES"] = str(CONFIG.gpu_device)
+
+import click  # noqa: E402
+
+from tts.cli.lazy_group import LazyGroup  # noqa: E402
+
+
+@click.group(
+    cls=LazyGroup,
+    lazy_subcommands={
+        "run": "tts.cli.commands.run:run",
+        "db": "tts.cli.commands.db:db",
+        "config-info": "tts.cli.commands.config_info:config_info",
+        "test-gen": "tts.cli.commands.test_gen:test_gen",
+    },
+)
+@click.version_option(version="0.1.0")
+def main():
+    """TTS Inference - TTS streaming server."""
+    pass
@@ -0,0 +1 @@
+"""CLI subcommands, one module per command, loaded lazily by tts.cli."""
@@ -0,0 +1,57 @@
+"""`tts config-info` command."""
+
+from textwrap import dedent
+
+import click
+
+from tts.utils.config import get_config
+
+
+_CONFIG_INFO = dedent("""\
+    TTS Inference Configuration
+    ========================================
+    Engine: {tts_engine}
+    Voice Directory: {voice_dir}
+    Voice Audio Directory: {voice_audio_dir}
+    Database Path: {database_path}
+    API Key Configured: {api_key_configured}
+
+    FastAPI Settings:
+      Host: {fastapi_host}
+      Port: {fastapi_port}
+
+    ZMQ Settings:
+      Input Address: {zmq_input_address}
+      PUB Address: {zmq_pub_address}
+      Workers: {zmq_workers}
+
+    Model Settings:
+      Offload Timeout: {offload_timeout}s
+      Keep Warm: {keep_warm}
+      Audio Cache Size (REST only): {audio_cache_size}
+
+    Log Level: {log_level}
+    ========================================
+""")
+
+
+@click.command()
+def config_info():
+    """Display current configuration."""
+    cfg = get_config()
+    click.echo(_CONFIG_INFO.format(
+        tts_engine=cfg.tts_engine,
+        voice_dir=cfg.voice_dir,
+        voice_audio_dir=cfg.voice_audio_dir,
+        database_path=cfg.database_path,
+        api_key_configured="Yes" if cfg.api_key else "No",
+        fastapi_host=cfg.fastapi_host,
+        fastapi_port=cfg.fastapi_port,
+        zmq_input_address=cfg.zmq_input_address,
+        zmq_pub_address=cfg.zmq_pub_address if cfg.zmq_pub_address else "Not configured",
+        zmq_workers=cfg.zmq_workers,
+        offload_timeout=cfg.offload_timeout,
+        keep_warm="Yes" if cfg.keep_warm else "No",
+        audio_cache_size=cfg.audio_cache_size or "Disabled",
+        log_level=cfg.log_level,
+    ))
@@ -0,0 +1,17 @@
+"""`tts db` command group."""
+
+import click
+
+from tts.cli.lazy_group import LazyGroup
+
+
+@click.group(
+    cls=LazyGroup,
+    lazy_subcommands={
+        "migrate": "tts.cli.commands.migrate:migrate",
+        "migration-status": "tts.cli.commands.migration_status:migration_status",
+    },
+)
+def db():
+    """Database management commands."""
+    pass
@@ -0,0 +1,41 @@
+"""`tts run fastapi` command."""
+
+import logging
+
+import click
+
+from tts.cli.common import apply_config_overrides, validate_api_key
+from tts.cli.options import engine_option, log_level_option, offload_timeout_option
+from tts.utils.config import get_config
+from tts.utils.logging import setup_logging
+
+
+@click.command()
+@click.option("--host", default=None, help="Host to bind to (default: from env or 0.0.0.0)")
+@click.option("--port", default=None, type=int, help="Port to bind to (default: from env or 20480)")
+@log_level_option
+@click.option("--reload", is_flag=True, help="Enable auto-reload for development")
+@offload_timeout_option
+@click.option("--keep-warm", is_flag=True, help="Keep model loaded in memory (disable auto-offloading)")
+@engine_option
+def fastapi(host, port, log_level, reload, offload_timeout, keep_warm, engine):
+    """Run FastAPI HTTP/WebSocket server."""
+    import uvicorn
+
+    cfg = get_config()
+    apply_config_overrides(log_level=log_level, host=host, port=port, offload_timeout=offload_timeout, keep_warm=keep_warm, engine=engine)
+    setup_logging(cfg.log_level)
+
+    logger = logging.getLogger(__name__)
+    logger.info("Starting TTS Inference in FastAPI mode")
+    logger.info(f"Host: {cfg.fastapi_host}, Port: {cfg.fastapi_port}")
+
+    validate_api_key(logger)
+
+    uvicorn.run(
+        "tts.server.fastapi_server:app",
+        host=cfg.fastapi_host,
+        port=cfg.fastapi_port,
+        reload=reload,
+        log_level=cfg.log_level.lower(),
+    )
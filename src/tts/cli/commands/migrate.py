@@ -0,0 +1,39 @@
+"""`tts db migrate` command."""
+
+import logging
+import sys
+from textwrap import dedent
+
+import click
+
+from tts.cli.options import db_log_level_option
+from tts.utils.config import get_config
+from tts.utils.logging import setup_logging
+
+
+_MIGRATE_BANNER = dedent("""\
+    Running database migrations...
+    Database: {database_path}
+""")
+
+
+@click.command()
+@db_log_level_option
+def migrate(log_level):
+    """Run database migrations."""
+    from tts.services import DatabaseService
+
+    cfg = get_config()
+    setup_logging(log_level)
+    logger = logging.getLogger(__name__)
+
+    click.echo(_MIGRATE_BANNER.format(database_path=cfg.database_path))
+
+    try:
+        service = DatabaseService()
+        service.run_migrations()
+        click.echo("\n✓ Migrations complete!")
+    except Exception as e:
+        click.echo(f"✗ Migration failed: {e}", err=True)
+        logger.error("Migration error", exc_info=True)
+        sys.exit(1)
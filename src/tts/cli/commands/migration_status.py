@@ -0,0 +1,24 @@
+"""`tts db migration-status` command."""
+
+import sys
+
+import click
+
+from tts.cli.options import db_log_level_option
+from tts.utils.logging import setup_logging
+
+
+@click.command()
+@db_log_level_option
+def migration_status(log_level):
+    """Show database migration status."""
+    from tts.services import DatabaseService
+
+    setup_logging(log_level)
+
+    try:
+        service = DatabaseService()
+        click.echo(service.get_migration_history_display())
+    except Exception as e:
+        click.echo(f"Error: {e}", err=True)
+        sys.exit(1)
@@ -0,0 +1,17 @@
+"""`tts run` command group."""
+
+import click
+
+from tts.cli.lazy_group import LazyGroup
+
+
+@click.group(
+    cls=LazyGroup,
+    lazy_subcommands={
+        "fastapi": "tts.cli.commands.fastapi:fastapi",
+        "zmq": "tts.cli.commands.zmq:zmq",
+    },
+)
+def run():
+    """Run the server in different modes."""
+    pass
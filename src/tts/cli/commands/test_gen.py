@@ -0,0 +1,63 @@
+"""`tts test-gen` command."""
+
+import asyncio
+import logging
+import sys
+from textwrap import dedent
+
+import click
+
+from tts.utils.logging import setup_logging
+
+
+_START_BANNER = dedent("""\
+    Generating test samples...
+    Text: {text}
+    Output directory: {output_dir}
+""")
+
+_RESULT_SUMMARY = dedent("""\
+    ✓ Generated {samples} samples at {sample_rate}Hz
+      Duration: {duration:.2f} seconds
+""")
+
+_DONE_HINT = dedent("""\
+
+    Done! Check the files with:
+      file {output_dir}/*
+      ffplay {output_dir}/test.wav
+""")
+
+
+@click.command()
+@click.option("--text", default="Hello world, this is a test of the text to speech system.", help="Text to synthesize")
+@click.option("--voice-id", required=True, help="Voice ID to use for synthesis")
+@click.option("--output-dir", default="./test_samples", help="Directory to save test files")
+def test_gen(text, voice_id, output_dir):
+    """Generate test audio files in all formats for debugging."""
+    from tts.services import TTSService
+
+    setup_logging("INFO")
+    logger = logging.getLogger(__name__)
+
+    click.echo(_START_BANNER.format(text=text, output_dir=output_dir))
+
+    try:
+        results = asyncio.run(TTSService.generate_test_samples(
+            text=text,
+            voice_id=voice_id,
+            output_dir=output_dir,
+        ))
+
+        summary = _RESULT_SUMMARY.format(
+            samples=results.samples,
+            sample_rate=results.sample_rate,
+            duration=results.duration,
+        )
+        saved = [f"✓ Saved {info.path} ({info.size:,} bytes)" for info in results.files.values()]
+        click.echo("\n".join([summary, *saved, _DONE_HINT.format(output_dir=output_dir)]))
+
+    except Exception as e:
+        click.echo(f"✗ Generation failed: {e}", err=True)
+        logger.error("Test generation error", exc_info=True)
+        sys.exit(1)
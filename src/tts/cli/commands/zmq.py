@@ -0,0 +1,57 @@
+"""`tts run zmq` command."""
+
+import asyncio
+import logging
+import sys
+
+import click
+
+from tts.cli.common import apply_config_overrides, validate_api_key
+from tts.cli.options import engine_option, log_level_option, offload_timeout_option
+from tts.utils.config import get_config
+from tts.utils.logging import setup_logging
+
+
+@click.command()
+@click.option("--input-address", default=None, help="Input ROUTER address (overrides TTS_INPUT_ADDRESS)")
+@click.option("--pub-address", default=None, help="PUB broadcast address (overrides TTS_PUB_ADDRESS; pass '' to disable)")
+@log_level_option
+@offload_timeout_option
+@click.option("--keep-warm", is_flag=True, help="Keep model loaded in memory")
+@engine_option
+def zmq(input_address, pub_address, log_level, offload_timeout, keep_warm, engine):
+    """Run ZMQ ROUTER server.
+
+    PUB broadcasting is on by default (TTS_PUB_ADDRESS defaults to tcp://*:20502).
+    All audio frames are broadcast to SUB subscribers; error and complete frames are
+    also ACKed back to the requesting DEALER so upstream callers can observe failures.
+    Set TTS_PUB_ADDRESS='' or pass --pub-address='' to disable PUB and route everything
+    back via ROUTER only.
+    """
+    from tts.server import run_zmq_server
+
+    cfg = get_config()
+    apply_config_overrides(log_level=log_level, offload_timeout=offload_timeout, keep_warm=keep_warm, engine=engine)
+    setup_logging(cfg.log_level)
+
+    logger = logging.getLogger(__name__)
+    logger.info("Starting TTS Inference in ZMQ mode")
+
+    zmq_input = input_address or cfg.zmq_input_address
+    zmq_pub = pub_address if pub_address is not None else cfg.zmq_pub_address
+
+    logger.info(f"Input address: {zmq_input}")
+    if zmq_pub:
+        logger.info(f"PUB address: {zmq_pub}")
+    else:
+        logger.info("PUB broadcasting disabled — responses routed via ROUTER only")
+
+    validate_api_key(logger)
+
+    try:
+        asyncio.run(run_zmq_server(zmq_input, zmq_pub))
+    except KeyboardInterrupt:
+        logger.info("Received interrupt signal, shutting down")
+    except Exception as e:
+        logger.error(f"Server error: {e}", exc_info=True)
+        sys.exit(1)
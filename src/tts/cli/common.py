@@ -0,0 +1,32 @@
+"""Helpers shared by CLI commands."""
+
+import sys
+
+import click
+
+from tts.utils.config import CONFIG
+
+
+def apply_config_overrides(log_level=None, host=None, port=None, offload_timeout=None, keep_warm=None, engine=None):
+    if log_level:
+        CONFIG.log_level = log_level
+    if host:
+        CONFIG.fastapi_host = host
+    if port:
+        CONFIG.fastapi_port = port
+    if offload_timeout is not None:
+        CONFIG.offload_timeout = offload_timeout
+    if keep_warm:
+        CONFIG.keep_warm = True
+    if engine:
+        CONFIG.tts_engine = engine
+
+
+def validate_api_key(logger):
+    try:
+        CONFIG.validate_api_key()
+        logger.info("API key validation successful")
+    except ValueError as e:
+        logger.error(str(e))
+        click.echo(f"Error: {e}", err=True)
+        sys.exit(1)
@@ -0,0 +1,35 @@
+"""Click group that imports its subcommands on demand."""
+
+import importlib
+
+import click
+
+
+class LazyGroup(click.Group):
+    """Group whose subcommands are resolved from import paths when used.
+
+    ``lazy_subcommands`` maps a command name to ``"module.path:attribute"``.
+    The module is imported the first time Click asks for that command.
+    """
+
+    def __init__(self, *args, lazy_subcommands: dict[str, str] | None = None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.lazy_subcommands = lazy_subcommands or {}
+
+    def list_commands(self, ctx: click.Context) -> list[str]:
+        return sorted([*super().list_commands(ctx), *self.lazy_subcommands])
+
+    def get_command(self, ctx: click.Context, cmd_name: str) -> click.Command | None:
+        if cmd_name in self.lazy_subcommands:
+            return self._load(cmd_name)
+        return super().get_command(ctx, cmd_name)
+
+    def _load(self, cmd_name: str) -> click.Command:
+        module_name, attr = self.lazy_subcommands[cmd_name].rsplit(":", 1)
+        command = getattr(importlib.import_module(module_name), attr)
+        if not isinstance(command, click.Command):
+            raise ValueError(
+                f"Lazy loading of {self.lazy_subcommands[cmd_name]} failed: "
+                f"not a click.Command ({type(command).__name__})"
+            )
+        return command
@@ -0,0 +1,35 @@
+"""Option decorators shared by several CLI commands.
+
+Defined once here so commands that take the same option share one definition
+and one ParamType instance instead of each building its own.
+"""
+
+import click
+
+ENGINE_CHOICE = click.Choice(["chatterbox", "omnivoice", "fish-speech"])
+
+engine_option = click.option(
+    "--engine",
+    default=None,
+    type=ENGINE_CHOICE,
+    help="TTS engine to use (default: from TTS_ENGINE env or chatterbox)",
+)
+
+log_level_option = click.option(
+    "--log-level",
+    default=None,
+    help="Log level (default: from env or INFO)",
+)
+
+offload_timeout_option = click.option(
+    "--offload-timeout",
+    default=None,
+    type=int,
+    help="Seconds of inactivity before offloading model (default: 600)",
+)
+
+db_log_level_option = click.option(
+    "--log-level",
+    default="INFO",
+    help="Log level (DEBUG, INFO, WARNING, ERROR)",
+)
@@ -0,0 +1,90 @@
+"""Console entry point with a fast path for trivial invocations.
+
+``tts --version`` is answered without importing Click, the config store or
+anything under tts.server. ``tts --help`` is served from a copy of Click's
+rendered help cached under ``$XDG_CACHE_HOME/tts``, keyed by version and
+wrap width and invalidated when any tts.cli source is newer than it. Every other invocation
+is dispatched to the Click group in tts.cli.
+
+Set TTS_EAGER=1 to bypass the cache and always go through Click.
+"""
+
+import os
+import shutil
+import sys
+
+from tts import __version__
+
+
+def _help_width() -> int:
+    # Same width Click's HelpFormatter derives from the terminal by default
+    return max(min(shutil.get_terminal_size().columns, 80) - 2, 50)
+
+
+def _help_cache_path(prog: str, width: int) -> str:
+    cache_home = os.getenv("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(cache_home, "tts", f"cli-help-{__version__}-{prog}-{width}.txt")
+
+
+def _cli_sources_mtime() -> float:
+    cli_dir = os.path.join(os.path.dirname(__file__), "cli")
+    latest = 0.0
+    for root, _, files in os.walk(cli_dir):
+        for name in files:
+            if name.endswith(".py"):
+                latest = max(latest, os.stat(os.path.join(root, name)).st_mtime)
+    return latest
+
+
+def _read_cached_help(path: str) -> str | None:
+    try:
+        if os.stat(path).st_mtime < _cli_sources_mtime():
+            return None
+        with open(path, encoding="utf-8") as f:
+            return f.read()
+    except OSError:
+        return None
+
+
+def _write_cached_help(path: str, text: str) -> None:
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.write(text)
+        os.replace(tmp_path, path)
+    except OSError:
+        # The cache is an optimisation only; fall back to rendering next time
+        pass
+
+
+def _render_help(prog: str, width: int) -> str:
+    import click
+
+    from tts.cli import main
+
+    with click.Context(main, info_name=prog, terminal_width=width) as ctx:
+        return ctx.get_help() + "\n"
+
+
+def entry():
+    """Run the CLI, short-circuiting top-level help and version requests."""
+    args = sys.argv[1:]
+    prog = os.path.basename(sys.argv[0]) or "tts"
+
+    if args == ["--version"]:
+        sys.stdout.write(f"{prog}, version {__version__}\n")
+        sys.exit(0)
+    if args == ["--help"] and os.getenv("TTS_EAGER") != "1":
+        width = _help_width()
+        path = _help_cache_path(prog, width)
+        text = _read_cached_help(path)
+        if text is None:
+            text = _render_help(prog, width)
+            _write_cached_help(path, text)
+        sys.stdout.write(text)
+        sys.exit(0)
+
+    from tts.cli import main
+
+    main()
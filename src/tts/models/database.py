@@ -5,6 +5,7 @@ from datetime import datetime
 from pathlib import Path
 import logging
 
+from tts.models import sqlite
 from tts.models.service_dataclasses import VoiceRecord
 
 logger = logging.getLogger(__name__)
@@ -17,7 +18,8 @@ class VoiceDatabase:
         self.db_path = db_path
 
     async def initialize(self):
-        async with aiosqlite.connect(self.db_path) as db:
+        async with sqlite.connect(self.db_path) as db:
+            await sqlite.enable_wal(db)
             await db.execute("""
                 CREATE TABLE IF NOT EXISTS voices (
                     voice_id TEXT PRIMARY KEY,
@@ -40,7 +42,7 @@ class VoiceDatabase:
         duration_seconds: float | None = None
     ) -> bool:
         try:
-            async with aiosqlite.connect(self.db_path) as db:
+            async with sqlite.connect(self.db_path) as db:
                 await db.execute(
                     """
                     INSERT INTO voices (voice_id, filename, sample_rate, voice_transcript, duration_seconds, uploaded_at)
@@ -56,7 +58,7 @@ class VoiceDatabase:
             return False
 
     async def get_voice(self, voice_id: str) -> VoiceRecord | None:
-        async with aiosqlite.connect(self.db_path) as db:
+        async with sqlite.connect(self.db_path) as db:
             db.row_factory = aiosqlite.Row
             async with db.execute(
                 "SELECT * FROM voices WHERE voice_id = ?",
@@ -68,14 +70,14 @@ class VoiceDatabase:
                 return None
 
     async def list_voices(self) -> list[VoiceRecord]:
-        async with aiosqlite.connect(self.db_path) as db:
+        async with sqlite.connect(self.db_path) as db:
             db.row_factory = aiosqlite.Row
             async with db.execute("SELECT * FROM voices ORDER BY uploaded_at DESC") as cursor:
                 rows = await cursor.fetchall()
                 return [VoiceRecord(**dict(row)) for row in rows]
 
     async def delete_voice(self, voice_id: str) -> bool:
-        async with aiosqlite.connect(self.db_path) as db:
+        async with sqlite.connect(self.db_path) as db:
             cursor = await db.execute(
                 "DELETE FROM voices WHERE voice_id = ?",
                 (voice_id,)
@@ -99,7 +101,7 @@ class VoiceDatabase:
             return False
 
         try:
-            async with aiosqlite.connect(self.db_path) as db:
+            async with sqlite.connect(self.db_path) as db:
                 await db.execute(
                     "UPDATE voices SET voice_id = ? WHERE voice_id = ?",
                     (new_voice_id, old_voice_id)
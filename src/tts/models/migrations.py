@@ -2,9 +2,12 @@
 
 import asyncio
 import aiosqlite
+from functools import lru_cache
 from pathlib import Path
 import logging
 
+from tts.models import sqlite
+
 logger = logging.getLogger(__name__)
 
 
@@ -18,12 +21,20 @@ class Migration:
 
     async def apply(self, db: aiosqlite.Connection):
         logger.info(f"Applying migration {self.version}: {self.name}")
-        await self.up(db)
-        await db.execute(
-            "INSERT INTO schema_migrations (version, name) VALUES (?, ?)",
-            (self.version, self.name)
-        )
-        await db.commit()
+        # One explicit transaction per version: the schema changes and the
+        # version row commit together (the sqlite3 module would otherwise
+        # autocommit DDL statement by statement)
+        await db.execute("BEGIN IMMEDIATE")
+        try:
+            await self.up(db)
+            await db.execute(
+                "INSERT INTO schema_migrations (version, name) VALUES (?, ?)",
+                (self.version, self.name)
+            )
+            await db.commit()
+        except Exception:
+            await db.rollback()
+            raise
         logger.info(f"Migration {self.version} applied successfully")
 
 
@@ -41,7 +52,8 @@ class MigrationManager:
         return decorator
 
     async def initialize_migrations_table(self):
-        async with aiosqlite.connect(self.db_path) as db:
+        async with sqlite.connect(self.db_path) as db:
+            await sqlite.enable_wal(db)
             await db.execute("""
                 CREATE TABLE IF NOT EXISTS schema_migrations (
                     version INTEGER PRIMARY KEY,
@@ -52,7 +64,7 @@ class MigrationManager:
             await db.commit()
 
     async def get_current_version(self) -> int:
-        async with aiosqlite.connect(self.db_path) as db:
+        async with sqlite.connect(self.db_path) as db:
             async with db.execute(
                 "SELECT name FROM sqlite_master WHERE type='table' AND name='schema_migrations'"
             ) as cursor:
@@ -78,7 +90,7 @@ class MigrationManager:
 
         logger.info(f"Running {len(pending)} pending migrations from version {current_version}")
 
-        async with aiosqlite.connect(self.db_path) as db:
+        async with sqlite.connect(self.db_path, cache_kib=sqlite.MIGRATION_CACHE_KIB) as db:
             for migration in pending:
                 await migration.apply(db)
 
@@ -88,7 +100,7 @@ class MigrationManager:
     async def get_migration_history(self) -> list[dict]:
         await self.initialize_migrations_table()
 
-        async with aiosqlite.connect(self.db_path) as db:
+        async with sqlite.connect(self.db_path) as db:
             db.row_factory = aiosqlite.Row
             async with db.execute(
                 "SELECT * FROM schema_migrations ORDER BY version"
@@ -113,5 +125,7 @@ class SyncMigrationManager:
         return asyncio.run(self._manager.get_migration_history())
 
 
+@lru_cache(maxsize=None)
 def get_migrator(db_path: Path) -> SyncMigrationManager:
+    """Return the migrator for a database, shared across callers."""
     return SyncMigrationManager(db_path)
@@ -1,10 +1,19 @@
 """Pydantic models for request and response schemas."""
 
+import re
 from typing import Annotated, Literal
 from datetime import datetime
 
 import msgpack
-from pydantic import BaseModel, Field, field_validator, model_validator
+from pydantic import BaseModel, Field, TypeAdapter, field_validator, model_validator
+
+# Packer keeps its internal buffer between calls; serialization here runs on
+# the event loop thread, so one shared instance is safe.
+_PACKER = msgpack.Packer(use_bin_type=True)
+_UNPACKER_KW = {"raw": False}
+
+INVALID_VOICE_ID_CHARS = '/\\:*?"<>|'
+INVALID_VOICE_ID_RE = re.compile(f"[{re.escape(INVALID_VOICE_ID_CHARS)}]")
 
 
 class BaseVoiceConfig(BaseModel):
@@ -19,11 +28,11 @@ class BaseVoiceConfig(BaseModel):
         return v
 
     def to_msgpack(self) -> bytes:
-        return msgpack.packb(self.model_dump(), use_bin_type=True)
+        return _PACKER.pack(self.model_dump())
 
     @classmethod
     def from_msgpack(cls, data: bytes):
-        return cls(**msgpack.unpackb(data, raw=False))
+        return cls.model_validate(msgpack.unpackb(data, **_UNPACKER_KW))
 
 
 class ChatterboxVoiceConfig(BaseVoiceConfig):
@@ -63,7 +72,7 @@ class TTSRequest(BaseModel):
     text: str = Field(..., min_length=1, max_length=10000, description="Text to synthesize")
     voice_config: VoiceConfig = Field(default_factory=ChatterboxVoiceConfig)
     voice_id: str | None = Field(None, description="Shorthand voice ID; merged into voice_config if voice_config.voice_id is not set")
-    audio_format: Literal["pcm", "wav", "vorbis"] = Field("pcm", description="Output audio format")
+    audio_format: Literal["pcm", "pcm_s8", "wav", "vorbis"] = Field("pcm", description="Output audio format")
     sample_rate: int | None = Field(None, ge=20480, le=420480, description="Output sample rate (defaults to model.sr)")
 
     @field_validator("text")
@@ -80,11 +89,11 @@ class TTSRequest(BaseModel):
         return self
 
     def to_msgpack(self) -> bytes:
-        return msgpack.packb(self.model_dump(), use_bin_type=True)
+        return _PACKER.pack(self.model_dump())
 
     @classmethod
     def from_msgpack(cls, data: bytes):
-        return cls(**msgpack.unpackb(data, raw=False))
+        return TTS_REQUEST_ADAPTER.validate_python(msgpack.unpackb(data, **_UNPACKER_KW))
 
 
 class VoiceUploadRequest(BaseModel):
@@ -95,19 +104,20 @@ class VoiceUploadRequest(BaseModel):
     @field_validator("voice_id")
     @classmethod
     def validate_voice_id(cls, v):
-        if not v.strip():
+        stripped = v.strip()
+        if not stripped:
             raise ValueError("voice_id cannot be empty")
-        invalid_chars = set('/\\:*?"<>|')
-        if any(char in v for char in invalid_chars):
-            raise ValueError(f"voice_id cannot contain: {' '.join(invalid_chars)}")
-        return v.strip()
+        if INVALID_VOICE_ID_RE.search(stripped):
+            raise ValueError(f"voice_id cannot contain: {' '.join(INVALID_VOICE_ID_CHARS)}")
+        return stripped
 
     @field_validator("voice_transcript")
     @classmethod
     def validate_transcript(cls, v):
-        if not v.strip():
+        stripped = v.strip()
+        if not stripped:
             raise ValueError("voice_transcript cannot be empty")
-        return v.strip()
+        return stripped
 
 
 class VoiceInfo(BaseModel):
@@ -118,6 +128,15 @@ class VoiceInfo(BaseModel):
     duration_seconds: float | None = None
     uploaded_at: str
 
+    @classmethod
+    def from_trusted(cls, **data) -> "VoiceInfo":
+        """Build from an already-typed database record without re-validating.
+
+        Only for rows read back from our own database; anything that comes
+        from a client must go through normal validation.
+        """
+        return cls.model_construct(**data)
+
 
 class VoiceListResponse(BaseModel):
     voices: list[VoiceInfo]
@@ -165,3 +184,7 @@ class ErrorResponse(BaseModel):
 class ModelInfoResponse(BaseModel):
     model: str
     sample_rate: int | None = None
+
+
+# Shared validators for request dicts decoded off the wire (ZMQ, WebSocket)
+TTS_REQUEST_ADAPTER = TypeAdapter(TTSRequest)
@@ -2,14 +2,14 @@ from dataclasses import dataclass
 import numpy as np
 
 
-@dataclass
+@dataclass(slots=True)
 class MigrationRecord:
     version: str
     name: str
     applied_at: str
 
 
-@dataclass
+@dataclass(slots=True)
 class MigrationStatus:
     database_path: str
     current_version: str | int
@@ -17,21 +17,21 @@ class MigrationStatus:
     has_migrations: bool
 
 
-@dataclass
+@dataclass(slots=True)
 class ModelStatus:
     model_loaded: bool
     voice_dir_accessible: bool
     database_accessible: bool
 
 
-@dataclass
+@dataclass(slots=True)
 class UnloadResult:
     success: bool
     message: str
     was_loaded: bool
 
 
-@dataclass
+@dataclass(slots=True)
 class VoiceRecord:
     voice_id: str
     filename: str
@@ -41,13 +41,13 @@ class VoiceRecord:
     uploaded_at: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class TestSamplesFile:
     path: str
     size: int
 
 
-@dataclass
+@dataclass(slots=True)
 class TestSamplesResult:
     sample_rate: int
     duration: float
@@ -55,7 +55,7 @@ class TestSamplesResult:
     files: dict[str, TestSamplesFile]
 
 
-@dataclass
+@dataclass(slots=True)
 class ChatterboxParams:
     text: str
     voice_id: str
@@ -69,7 +69,7 @@ class ChatterboxParams:
     repetition_penalty: float
 
 
-@dataclass
+@dataclass(slots=True)
 class OmniVoiceParams:
     text: str
     voice_id: str | None
@@ -0,0 +1,35 @@
+"""Shared SQLite connection setup."""
+
+from contextlib import asynccontextmanager
+from pathlib import Path
+from typing import AsyncIterator
+
+import aiosqlite
+
+# Page cache sizes in KiB (negative PRAGMA cache_size values are KiB)
+DEFAULT_CACHE_KIB = 64 * 1024
+MIGRATION_CACHE_KIB = 256 * 1024
+
+_CONNECTION_PRAGMAS = (
+    "PRAGMA synchronous=NORMAL;"
+    "PRAGMA busy_timeout=30000;"
+    "PRAGMA temp_store=MEMORY;"
+    "PRAGMA mmap_size=268435456;"
+)
+
+
+@asynccontextmanager
+async def connect(db_path: Path, cache_kib: int = DEFAULT_CACHE_KIB) -> AsyncIterator[aiosqlite.Connection]:
+    """Open a connection with the per-connection PRAGMAs applied.
+
+    journal_mode=WAL is persistent in the database file, so it is set once by
+    enable_wal() when the schema is initialized rather than on every open.
+    """
+    async with aiosqlite.connect(db_path) as db:
+        await db.executescript(f"{_CONNECTION_PRAGMAS}PRAGMA cache_size=-{cache_kib};")
+        yield db
+
+
+async def enable_wal(db: aiosqlite.Connection) -> None:
+    """Switch the database to write-ahead logging."""
+    await db.execute("PRAGMA journal_mode=WAL")
@@ -1,6 +1,30 @@
-"""Server implementations for TTS Inference."""
+"""Server implementations for TTS Inference.
 
-from tts.server.fastapi_server import app as fastapi_app
-from tts.server.zmq_server import ZMQServer, run_zmq_server
+Each server is imported on first attribute access, so running the ZMQ server
+doesn't import FastAPI and its routes, and vice versa.
+"""
 
-__all__ = ["fastapi_app", "ZMQServer", "run_zmq_server"]
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from tts.server.fastapi_server import app as fastapi_app
+    from tts.server.zmq_server import ZMQServer, run_zmq_server
+
+_EXPORTS = {
+    "fastapi_app": ("tts.server.fastapi_server", "app"),
+    "ZMQServer": ("tts.server.zmq_server", "ZMQServer"),
+    "run_zmq_server": ("tts.server.zmq_server", "run_zmq_server"),
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name: str):
+    target = _EXPORTS.get(name)
+    if target is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module_name, attr = target
+    value = getattr(importlib.import_module(module_name), attr)
+    globals()[name] = value
+    return value
@@ -1,4 +1,5 @@
 """Shared server initialization components and utilities."""
+import asyncio
 import logging
 import numpy as np
 
@@ -23,37 +24,41 @@ async def initialize_server_components() -> tuple[VoiceDatabase, VoiceManager, V
     CONFIG.ensure_directories()
 
     db = VoiceDatabase(CONFIG.database_path)
-    await db.initialize()
+    tts_engine = get_tts_engine()
+
+    # Schema setup and the model load are independent; the model load is the
+    # long pole, so the database is ready well before it finishes.
+    await asyncio.gather(db.initialize(), tts_engine.initialize())
 
     voice_manager = VoiceManager(db)
     voice_service = VoiceService(voice_manager, db)
 
-    tts_engine = get_tts_engine()
-    await tts_engine.initialize()
-
     logger.info("Shared server components initialized")
 
     return db, voice_manager, voice_service
 
 
-async def load_voice_reference_or_raise(
+async def load_voice_or_raise(
     voice_service: VoiceService,
     voice_id: str | None,
     raise_on_not_found: bool = True
-) -> np.ndarray | None:
+) -> tuple[np.ndarray | None, str | None]:
+    """Return (voice_reference, voice_transcript), or (None, None) when not found."""
     if not voice_id:
         if raise_on_not_found:
             raise ValueError("No voice_id provided")
-        return None
-    voice_reference = await voice_service.load_voice_reference(voice_id)
-    if voice_reference is None and raise_on_not_found:
-        raise ValueError(f"Voice not found: {voice_id}")
-    return voice_reference
+        return None, None
+    bundle = await voice_service.get_voice_bundle(voice_id)
+    if bundle is None:
+        if raise_on_not_found:
+            raise ValueError(f"Voice not found: {voice_id}")
+        return None, None
+    voice_reference, record = bundle
+    return voice_reference, record.voice_transcript
 
 
 def get_output_sample_rate(request: TTSRequest) -> int:
-    tts_engine = get_tts_engine()
-    return request.sample_rate or tts_engine.sample_rate
+    return request.sample_rate or get_tts_engine().sample_rate
 
 
 def get_model_info() -> dict:
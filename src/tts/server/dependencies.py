@@ -2,8 +2,12 @@
 
 from typing import Optional
 
+from fastapi import Request
+from fastapi.exceptions import RequestValidationError
+from pydantic import ValidationError
+
 from tts.services import VoiceService
-from tts.models import VoiceDatabase
+from tts.models import TTSRequest, VoiceDatabase
 from tts.tts import VoiceManager
 
 # Global instances (set during lifespan)
@@ -12,8 +16,11 @@ voice_manager: Optional[VoiceManager] = None
 voice_service: Optional[VoiceService] = None
 
 
-def get_voice_service() -> VoiceService:
+async def get_voice_service() -> VoiceService:
     """Get voice service dependency.
+
+    Declared async so FastAPI calls it inline on the event loop instead of
+    dispatching a plain def dependency to its threadpool on every request.
     
     Returns:
         VoiceService instance
@@ -24,3 +31,23 @@ def get_voice_service() -> VoiceService:
     if voice_service is None:
         raise RuntimeError("Voice service not initialized")
     return voice_service
+
+
+async def parse_tts_request(request: Request) -> TTSRequest:
+    """Parse and validate a TTSRequest body straight from the raw JSON bytes.
+
+    pydantic-core parses and validates in one pass, skipping the dict that
+    FastAPI's own body handling builds with json.loads first.
+
+    Raises:
+        RequestValidationError: If the body is not a valid TTSRequest (422)
+    """
+    body = await request.body()
+    try:
+        return TTSRequest.model_validate_json(body)
+    except ValidationError as e:
+        errors = [
+            {**error, "loc": ("body", *error["loc"])}
+            for error in e.errors(include_url=False)
+        ]
+        raise RequestValidationError(errors, body=body)
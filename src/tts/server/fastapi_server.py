@@ -4,8 +4,9 @@ import logging
 from contextlib import asynccontextmanager
 
 from fastapi import FastAPI, Request
-from fastapi.responses import JSONResponse
+from fastapi.responses import Response
 
+from tts.models import TTSRequest
 from tts.utils.config import CONFIG
 from tts.server import dependencies
 from tts.server.common import initialize_server_components
@@ -14,6 +15,8 @@ from tts.services import get_synthesis_queue, stop_synthesis_queue
 
 logger = logging.getLogger(__name__)
 
+_INTERNAL_ERROR_BODY = b'{"error":"Internal server error"}'
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
@@ -48,11 +51,28 @@ app.include_router(utilities_router)
 app.include_router(generation_router)
 app.include_router(voices_router)
 
+_default_openapi = app.openapi
+
+
+def _openapi() -> dict:
+    """Default OpenAPI schema plus the TTSRequest body read by parse_tts_request."""
+    if app.openapi_schema is None:
+        schema = _default_openapi()
+        request_schema = TTSRequest.model_json_schema(ref_template="#/components/schemas/{model}")
+        components = schema.setdefault("components", {}).setdefault("schemas", {})
+        components.update(request_schema.pop("$defs", {}))
+        components["TTSRequest"] = request_schema
+    return app.openapi_schema
+
+
+app.openapi = _openapi
+
 
 @app.exception_handler(Exception)
 async def global_exception_handler(request: Request, exc: Exception):
     logger.error(f"Unhandled exception on {request.method} {request.url.path}: {exc}", exc_info=True)
-    return JSONResponse(
+    return Response(
+        content=_INTERNAL_ERROR_BODY,
         status_code=500,
-        content={"error": "Internal server error"}
+        media_type="application/json"
     )
@@ -6,13 +6,13 @@ from fastapi import APIRouter, Depends, HTTPException, WebSocket, WebSocketDisco
 from fastapi.responses import StreamingResponse
 
 from tts.models import TTSRequest
-from tts.models.schemas import OmniVoiceVoiceConfig
+from tts.models.schemas import OmniVoiceVoiceConfig, TTS_REQUEST_ADAPTER
 from tts.auth import verify_api_key
 from tts.services import TTSService, VoiceService
 from tts.utils.config import CONFIG
 from tts.utils.audio_utils import AudioStreamEncoder
-from tts.server.common import load_voice_reference_or_raise, get_output_sample_rate
-from tts.server.dependencies import get_voice_service
+from tts.server.common import load_voice_or_raise, get_output_sample_rate
+from tts.server.dependencies import get_voice_service, parse_tts_request
 
 logger = logging.getLogger(__name__)
 
@@ -28,11 +28,9 @@ async def _resolve_voice(
     voice_id = request.voice_config.voice_id
 
     if voice_id:
-        voice_reference = await load_voice_reference_or_raise(
+        return await load_voice_or_raise(
             voice_service, voice_id, raise_on_not_found=raise_on_not_found
         )
-        voice_transcript = await voice_service.get_voice_transcript(voice_id) if voice_reference is not None else None
-        return voice_reference, voice_transcript
 
     if isinstance(request.voice_config, OmniVoiceVoiceConfig) and request.voice_config.voice_description:
         return None, None
@@ -45,9 +43,19 @@ async def _resolve_voice(
     return None, None
 
 
-@router.post("/synthesize")
+# parse_tts_request reads the body itself, so FastAPI can't infer its schema;
+# TTSRequest is registered under components by fastapi_server
+@router.post(
+    "/synthesize",
+    openapi_extra={
+        "requestBody": {
+            "content": {"application/json": {"schema": {"$ref": "#/components/schemas/TTSRequest"}}},
+            "required": True,
+        }
+    },
+)
 async def synthesize_tts(
-    request: TTSRequest,
+    request: TTSRequest = Depends(parse_tts_request),
     voice_service: VoiceService = Depends(get_voice_service),
     api_key: str = Depends(verify_api_key)
 ):
@@ -89,7 +97,7 @@ async def websocket_tts(
         request_data = {k: v for k, v in data.items() if k != "api_key"}
 
         try:
-            request = TTSRequest(**request_data)
+            request = TTS_REQUEST_ADAPTER.validate_python(request_data)
         except Exception:
             await websocket.send_json({"error": "Invalid request"})
             await websocket.close(code=1003)
@@ -127,7 +135,7 @@ async def websocket_tts(
             request, voice_reference, voice_transcript
         ):
             encoded_chunk = encoder.encode_chunk(audio_chunk)
-            if encoded_chunk:
+            if encoded_chunk is not None:
                 await websocket.send_bytes(encoded_chunk)
 
         final_chunk = encoder.finalize()
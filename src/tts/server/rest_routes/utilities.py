@@ -1,7 +1,9 @@
 """Utility endpoints (health, ready, model management)."""
 
 import logging
+import time
 from datetime import datetime, timezone
+from functools import lru_cache
 
 from fastapi import APIRouter, Depends, HTTPException
 from fastapi.responses import JSONResponse
@@ -15,13 +17,19 @@ logger = logging.getLogger(__name__)
 router = APIRouter(tags=["utilities"])
 
 
+@lru_cache(maxsize=1)
+def _cached_ts(second: int) -> str:
+    """ISO timestamp for a whole UTC second; repeat polls within it reuse the string."""
+    return datetime.fromtimestamp(second, timezone.utc).isoformat()
+
+
 @router.get("/health", response_model=HealthResponse)
 async def health_check():
     """Health check endpoint."""
-    return HealthResponse(
+    return HealthResponse.model_construct(
         status="healthy",
         version="0.1.0",
-        timestamp=datetime.now(timezone.utc).isoformat()
+        timestamp=_cached_ts(int(time.time()))
     )
 
 
@@ -31,14 +39,16 @@ async def readiness_check():
     status = ModelService.get_model_status()
     
     ready = (
-        status["model_loaded"] and 
-        status["voice_dir_accessible"] and 
-        status["database_accessible"]
+        status.model_loaded and 
+        status.voice_dir_accessible and 
+        status.database_accessible
     )
     
-    return ReadyResponse(
+    return ReadyResponse.model_construct(
         ready=ready,
-        **status
+        model_loaded=status.model_loaded,
+        voice_dir_accessible=status.voice_dir_accessible,
+        database_accessible=status.database_accessible,
     )
 
 
@@ -5,6 +5,7 @@ import logging
 from fastapi import APIRouter, Depends, HTTPException, UploadFile, File, Form
 
 from tts.models import VoiceInfo, VoiceListResponse, VoiceUploadResponse, VoiceDeleteResponse, VoiceRenameResponse
+from tts.models.schemas import INVALID_VOICE_ID_CHARS, INVALID_VOICE_ID_RE
 from tts.auth import verify_api_key
 from tts.services import VoiceService
 from tts.server.dependencies import get_voice_service
@@ -14,9 +15,13 @@ logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/voices", tags=["voices"])
 
 
-async def _raise_if_not_wav(filename: str):
-    if not filename.endswith('.wav'):
+async def _raise_if_not_wav(audio_file: UploadFile):
+    if not (audio_file.filename or "").lower().endswith('.wav'):
         raise HTTPException(status_code=400, detail="Only WAV files are supported")
+    head = await audio_file.read(12)
+    await audio_file.seek(0)
+    if head[:4] != b'RIFF' or head[8:12] != b'WAVE':
+        raise HTTPException(status_code=400, detail="Not a WAVE file")
 
 
 async def _raise_if_voice_exists(voice_service: VoiceService, voice_id: str):
@@ -53,7 +58,7 @@ async def upload_voice(
     """Upload a voice reference file."""
     logger.info(f"Voice upload request: {voice_id}, sample_rate={sample_rate}")
     
-    _raise_if_not_wav(audio_file.filename)
+    await _raise_if_not_wav(audio_file)
     await _raise_if_voice_exists(voice_service, voice_id)
     
     try:
@@ -80,7 +85,7 @@ async def list_voices(
     """List all uploaded voices."""
     voices_data = await voice_service.list_voices()
     voices = [
-        VoiceInfo(
+        VoiceInfo.from_trusted(
             voice_id=v.voice_id,
             filename=v.filename,
             sample_rate=v.sample_rate,
@@ -91,7 +96,7 @@ async def list_voices(
         for v in voices_data
     ]
     
-    return VoiceListResponse(
+    return VoiceListResponse.model_construct(
         voices=voices,
         total=len(voices)
     )
@@ -132,18 +137,18 @@ async def rename_voice(
     logger.info(f"Voice rename request: {voice_id} -> {new_voice_id}")
     
     # Validate new_voice_id
-    if not new_voice_id or not new_voice_id.strip():
+    new_voice_id = new_voice_id.strip()
+    if not new_voice_id:
         raise HTTPException(
             status_code=400,
             detail="New voice ID cannot be empty"
         )
     
     # Check for invalid characters in new_voice_id
-    invalid_chars = set('/\\:*?"<>|')
-    if any(char in new_voice_id for char in invalid_chars):
+    if INVALID_VOICE_ID_RE.search(new_voice_id):
         raise HTTPException(
             status_code=400,
-            detail=f"New voice ID cannot contain: {' '.join(invalid_chars)}"
+            detail=f"New voice ID cannot contain: {' '.join(INVALID_VOICE_ID_CHARS)}"
         )
     
     # Check if old voice exists
@@ -1,14 +1,16 @@
 """ZMQ TTS generation handler."""
 
 import logging
+from functools import lru_cache
+
 import msgpack
 
 from tts.models import TTSRequest
-from tts.models.schemas import OmniVoiceVoiceConfig
+from tts.models.schemas import OmniVoiceVoiceConfig, TTS_REQUEST_ADAPTER
 from tts.services import TTSService, VoiceService
 from tts.utils.audio_utils import AudioStreamEncoder
 from tts.utils.config import CONFIG
-from tts.server.common import load_voice_reference_or_raise, get_output_sample_rate
+from tts.server.common import load_voice_or_raise, get_output_sample_rate
 
 _ENGINE_DEFAULT_VOICE_CONFIG = {
     "chatterbox": {"type": "chatterbox"},
@@ -18,17 +20,29 @@ _ENGINE_DEFAULT_VOICE_CONFIG = {
 
 logger = logging.getLogger(__name__)
 
+_PACKER = msgpack.Packer(use_bin_type=True)
+
 
 def _get_client_id(identity_frames: list) -> str:
-    return identity_frames[0].hex()[:8] if identity_frames else "unknown"
+    return identity_frames[0][:4].hex() if identity_frames else "unknown"
 
 
 async def _send_error(identity_frames: list, send_message, error_msg: str):
-    await send_message(identity_frames, b"error", msgpack.packb({"error": error_msg}))
+    await send_message(identity_frames, b"error", _PACKER.pack({"error": error_msg}))
+
+
+@lru_cache(maxsize=32)
+def _metadata_blob(sample_rate: int, audio_format: str) -> bytes:
+    return _PACKER.pack({"status": "streaming", "sample_rate": sample_rate, "audio_format": audio_format})
+
+
+@lru_cache(maxsize=1024)
+def _completion_blob(chunk_count: int) -> bytes:
+    return _PACKER.pack({"status": "complete", "chunks": chunk_count})
 
 
-async def _send_metadata(identity_frames: list, send_message, metadata: dict):
-    await send_message(identity_frames, b"metadata", msgpack.packb(metadata))
+async def _send_metadata(identity_frames: list, send_message, sample_rate: int, audio_format: str):
+    await send_message(identity_frames, b"metadata", _metadata_blob(sample_rate, audio_format))
 
 
 async def _send_audio_chunk(identity_frames: list, send_message, encoded_chunk: bytes):
@@ -36,8 +50,7 @@ async def _send_audio_chunk(identity_frames: list, send_message, encoded_chunk:
 
 
 async def _send_complete(identity_frames: list, send_message, chunk_count: int):
-    completion = {"status": "complete", "chunks": chunk_count}
-    await send_message(identity_frames, b"complete", msgpack.packb(completion))
+    await send_message(identity_frames, b"complete", _completion_blob(chunk_count))
 
 
 async def _stream_audio(
@@ -46,18 +59,24 @@ async def _stream_audio(
     request: TTSRequest,
     voice_reference,
     voice_transcript,
+    output_sr: int,
 ) -> int:
-    output_sr = get_output_sample_rate(request)
     encoder = AudioStreamEncoder(request.audio_format, output_sr)
 
     chunk_count = 0
-    async for audio_chunk, sample_rate in TTSService.synthesize_streaming(
-        request, voice_reference, voice_transcript
-    ):
-        encoded_chunk = encoder.encode_chunk(audio_chunk)
-        if encoded_chunk:
+    stream = TTSService.synthesize_streaming(request, voice_reference, voice_transcript)
+    if request.audio_format == "pcm":
+        # Clients read raw PCM audio frames as one byte stream, so merging
+        # them only changes how many frames (and sends) there are
+        async for encoded_chunk in TTSService.batch_pcm(stream, encoder):
             await _send_audio_chunk(identity_frames, send_message, encoded_chunk)
             chunk_count += 1
+    else:
+        async for audio_chunk, sample_rate in stream:
+            encoded_chunk = encoder.encode_chunk(audio_chunk)
+            if encoded_chunk is not None:
+                await _send_audio_chunk(identity_frames, send_message, encoded_chunk)
+                chunk_count += 1
 
     final_chunk = encoder.finalize()
     if final_chunk:
@@ -74,7 +93,7 @@ async def handle_synthesize(identity_frames: list, request_dict: dict, voice_ser
             default = _ENGINE_DEFAULT_VOICE_CONFIG.get(CONFIG.tts_engine, {"type": "chatterbox"})
             request_dict = {**request_dict, "voice_config": default}
 
-        request = TTSRequest(**request_dict)
+        request = TTS_REQUEST_ADAPTER.validate_python(request_dict)
 
         voice_id = request.voice_config.voice_id or CONFIG.default_voice_id
         voice_description = (
@@ -97,7 +116,7 @@ async def handle_synthesize(identity_frames: list, request_dict: dict, voice_ser
 
         if voice_id:
             logger.info(f"TTS synthesis request from client {client_id_hex}: voice_id={voice_id}")
-            voice_reference = await load_voice_reference_or_raise(
+            voice_reference, voice_transcript = await load_voice_or_raise(
                 voice_service, voice_id, raise_on_not_found=False
             )
             if voice_reference is None:
@@ -106,19 +125,14 @@ async def handle_synthesize(identity_frames: list, request_dict: dict, voice_ser
                     f"Voice not found in database: {voice_id}"
                 )
                 return
-            voice_transcript = await voice_service.get_voice_transcript(voice_id)
         else:
             logger.info(f"TTS synthesis request from client {client_id_hex}: voice_design mode")
 
-        metadata = {
-            "status": "streaming",
-            "sample_rate": get_output_sample_rate(request),
-            "audio_format": request.audio_format
-        }
-        await _send_metadata(identity_frames, send_message, metadata)
+        output_sr = get_output_sample_rate(request)
+        await _send_metadata(identity_frames, send_message, output_sr, request.audio_format)
 
         chunk_count = await _stream_audio(
-            identity_frames, send_message, request, voice_reference, voice_transcript
+            identity_frames, send_message, request, voice_reference, voice_transcript, output_sr
         )
 
         await _send_complete(identity_frames, send_message, chunk_count)
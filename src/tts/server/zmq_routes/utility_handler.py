@@ -1,35 +1,56 @@
 """ZMQ utility handlers (health, model management)."""
 
 import logging
+from functools import lru_cache
+
 import msgpack
-from dataclasses import asdict
 
 from tts.services import ModelService
 from tts.tts.specs import engine_params, supported_engines
 
 logger = logging.getLogger(__name__)
 
+_PACKER = msgpack.Packer(use_bin_type=True)
+
 
 async def _send_response(identity_frames: list, send_message, data: dict):
-    await send_message(identity_frames, b"response", msgpack.packb(data))
+    await send_message(identity_frames, b"response", _PACKER.pack(data))
 
 
 async def _send_error(identity_frames: list, send_message, error: str):
-    await send_message(identity_frames, b"error", msgpack.packb({"error": error}))
+    await send_message(identity_frames, b"error", _PACKER.pack({"error": error}))
+
+
+def _status_fields(model_loaded: bool, voice_dir_accessible: bool, database_accessible: bool) -> dict:
+    return {
+        "model_loaded": model_loaded,
+        "voice_dir_accessible": voice_dir_accessible,
+        "database_accessible": database_accessible,
+    }
+
+
+# Health and ready replies depend only on the three status flags, so each of
+# the (at most 8) combinations is packed once
+@lru_cache(maxsize=8)
+def _health_blob(*flags: bool) -> bytes:
+    return _PACKER.pack({"status": "healthy", "version": "0.1.0", **_status_fields(*flags)})
+
+
+@lru_cache(maxsize=8)
+def _ready_blob(*flags: bool) -> bytes:
+    return _PACKER.pack({"ready": all(flags), **_status_fields(*flags)})
 
 
 async def handle_health(identity_frames: list, send_message):
     status = ModelService.get_model_status()
-    await _send_response(
-        identity_frames, send_message,
-        {"status": "healthy", "version": "0.1.0", **asdict(status)}
-    )
+    blob = _health_blob(status.model_loaded, status.voice_dir_accessible, status.database_accessible)
+    await send_message(identity_frames, b"response", blob)
 
 
 async def handle_ready(identity_frames: list, send_message):
     status = ModelService.get_model_status()
-    ready = status.model_loaded and status.voice_dir_accessible and status.database_accessible
-    await _send_response(identity_frames, send_message, {"ready": ready, **asdict(status)})
+    blob = _ready_blob(status.model_loaded, status.voice_dir_accessible, status.database_accessible)
+    await send_message(identity_frames, b"response", blob)
 
 
 async def handle_model_unload(identity_frames: list, send_message):
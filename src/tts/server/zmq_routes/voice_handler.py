@@ -10,13 +10,15 @@ from tts.services import VoiceService
 
 logger = logging.getLogger(__name__)
 
+_PACKER = msgpack.Packer(use_bin_type=True)
+
 
 async def _send_error(identity_frames: list, send_message, error: str):
-    await send_message(identity_frames, b"error", msgpack.packb({"error": error}))
+    await send_message(identity_frames, b"error", _PACKER.pack({"error": error}))
 
 
 async def _send_response(identity_frames: list, send_message, data: dict):
-    await send_message(identity_frames, b"response", msgpack.packb(data))
+    await send_message(identity_frames, b"response", _PACKER.pack(data))
 
 
 async def handle_list_voices(identity_frames: list, voice_service: VoiceService, send_message):
@@ -32,22 +34,27 @@ async def handle_list_voices(identity_frames: list, voice_service: VoiceService,
         await _send_error(identity_frames, send_message, str(e))
 
 
-async def _parse_upload_request(request_dict: dict) -> tuple[str, int, str, str]:
+def _parse_upload_request(request_dict: dict) -> tuple[str, int, str, bytes | str]:
     voice_id = request_dict.get("voice_id")
     sample_rate = request_dict.get("sample_rate")
     voice_transcript = request_dict.get("voice_transcript")
-    audio_data_b64 = request_dict.get("audio_data")
+    audio_data = request_dict.get("audio_data")
     
-    if not all([voice_id, sample_rate, voice_transcript, audio_data_b64]):
+    if not all([voice_id, sample_rate, voice_transcript, audio_data]):
         raise ValueError("Missing required fields: voice_id, sample_rate, voice_transcript, audio_data")
     
-    return voice_id, int(sample_rate), str(voice_transcript), audio_data_b64
+    return voice_id, int(sample_rate), str(voice_transcript), audio_data
+
 
+def _decode_audio(audio_data: bytes | str) -> io.BytesIO:
+    """Wrap uploaded audio for the voice service.
 
-async def _decode_audio(audio_data_b64: str) -> io.BytesIO:
+    Raw msgpack bin is used as-is; a str is taken to be the older base64 form.
+    """
+    if isinstance(audio_data, bytes):
+        return io.BytesIO(audio_data)
     try:
-        audio_bytes = base64.b64decode(audio_data_b64)
-        return io.BytesIO(audio_bytes)
+        return io.BytesIO(base64.b64decode(audio_data))
     except Exception as e:
         raise ValueError(f"Invalid audio data encoding: {str(e)}")
 
@@ -55,7 +62,7 @@ async def _decode_audio(audio_data_b64: str) -> io.BytesIO:
 async def handle_upload_voice(identity_frames: list, request_dict: dict, voice_service: VoiceService, send_message):
     """Handle voice upload request."""
     try:
-        voice_id, sample_rate, voice_transcript, audio_data_b64 = _parse_upload_request(request_dict)
+        voice_id, sample_rate, voice_transcript, audio_data = _parse_upload_request(request_dict)
         
         if await voice_service.voice_exists(voice_id):
             await _send_error(
@@ -64,7 +71,7 @@ async def handle_upload_voice(identity_frames: list, request_dict: dict, voice_s
             )
             return
         
-        audio_file = await _decode_audio(audio_data_b64)
+        audio_file = _decode_audio(audio_data)
         
         success = await voice_service.upload_voice(
             voice_id=voice_id,
@@ -92,7 +99,7 @@ async def handle_upload_voice(identity_frames: list, request_dict: dict, voice_s
         await _send_error(identity_frames, send_message, str(e))
 
 
-async def _get_voice_id(request_dict: dict) -> str:
+def _get_voice_id(request_dict: dict) -> str:
     voice_id = request_dict.get("voice_id")
     if not voice_id:
         raise ValueError("Missing required field: voice_id")
@@ -27,6 +27,25 @@ from tts.server.zmq_routes import (
 
 logger = logging.getLogger(__name__)
 
+# Received requests waiting for a free worker; the receive loop blocks once
+# this many are queued, and ZMQ then buffers up to _RCVHWM messages per peer
+# before it stops reading from that peer's connection
+_REQUEST_QUEUE_SIZE = 256
+_RCVHWM = 1000
+
+# Cheap request types served by their own small pool so probes and listings
+# are never stuck behind in-flight syntheses
+_CONTROL_REQUEST_TYPES = frozenset({
+    "health",
+    "ready",
+    "model_info",
+    "list_voices",
+    "list_engines",
+    "list_engine_params",
+})
+_CONTROL_WORKERS = 2
+_CONTROL_QUEUE_SIZE = 64
+
 
 class ZMQServer:
     """ZMQ ROUTER server for TTS streaming."""
@@ -47,6 +66,11 @@ class ZMQServer:
         self.pub_socket: zmq.asyncio.Socket | None = None
         self.running = False
 
+        # Requests are handled by fixed pools of worker tasks
+        self._requests: asyncio.Queue | None = None
+        self._control_requests: asyncio.Queue | None = None
+        self._workers: list[asyncio.Task] = []
+
         # Server components
         self.db = None
         self.voice_manager = None
@@ -71,8 +95,16 @@ class ZMQServer:
         await self.initialize()
         
         # Create ZMQ context and socket
-        self.context = zmq.asyncio.Context()
+        # One process-wide context (and IO thread) shared with the config subscriber
+        self.context = zmq.asyncio.Context.instance()
         self.socket = self.context.socket(zmq.ROUTER)
+        # Fail loudly (EHOSTUNREACH) instead of silently dropping replies to
+        # peers that are gone, and never block or drop a stream on SNDHWM.
+        # RCVHWM stays finite so a backlog pushes back on senders.
+        self.socket.setsockopt(zmq.ROUTER_MANDATORY, 1)
+        self.socket.setsockopt(zmq.SNDHWM, 0)
+        self.socket.setsockopt(zmq.RCVHWM, _RCVHWM)
+        self.socket.setsockopt(zmq.LINGER, 0)
         
         # Bind input socket
         self.socket.bind(self.input_address)
@@ -80,6 +112,8 @@ class ZMQServer:
         
         if self.pub_address:
             self.pub_socket = self.context.socket(zmq.PUB)
+            self.pub_socket.setsockopt(zmq.SNDHWM, 0)
+            self.pub_socket.setsockopt(zmq.LINGER, 0)
             self.pub_socket.bind(self.pub_address)
             logger.info(f"ZMQ PUB socket broadcasting on {self.pub_address}")
 
@@ -88,6 +122,14 @@ class ZMQServer:
         self._config_sub.on_change(lambda keys: CONFIG.reload(keys))
         self._config_sub_task = asyncio.create_task(self._config_sub.run())
 
+        self._requests = asyncio.Queue(maxsize=_REQUEST_QUEUE_SIZE)
+        self._control_requests = asyncio.Queue(maxsize=_CONTROL_QUEUE_SIZE)
+        self._workers = [
+            asyncio.create_task(self._worker(self._requests)) for _ in range(CONFIG.zmq_workers)
+        ] + [
+            asyncio.create_task(self._worker(self._control_requests)) for _ in range(_CONTROL_WORKERS)
+        ]
+
         self.running = True
         
         # Main server loop
@@ -108,9 +150,16 @@ class ZMQServer:
                     # Extract identity frames (all except last frame) and message data (last frame)
                     identity_frames = frames[:-1]
                     request_data = frames[-1]
-                    
-                    # Process request in background
-                    asyncio.create_task(self._handle_request(identity_frames, request_data))
+
+                    request_dict = await self._parse_request(identity_frames, request_data)
+                    if request_dict is None:
+                        continue
+
+                    # Hand off to the control or synthesis worker pool
+                    if request_dict.get("type", "synthesize") in _CONTROL_REQUEST_TYPES:
+                        await self._control_requests.put((identity_frames, request_dict))
+                    else:
+                        await self._requests.put((identity_frames, request_dict))
                     
                 except zmq.ZMQError as e:
                     if self.running:
@@ -123,35 +172,62 @@ class ZMQServer:
         finally:
             await self.stop()
     
-    async def _handle_request(self, identity_frames: list, request_data: bytes):
-        """Handle a single client request.
-        
+    async def _worker(self, requests: asyncio.Queue):
+        """Handle requests from one queue one at a time until cancelled."""
+        while True:
+            identity_frames, request_dict = await requests.get()
+            try:
+                await self._handle_request(identity_frames, request_dict)
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                # A worker must outlive any single request, or the pool shrinks
+                logger.exception("Unhandled error in request worker")
+            finally:
+                requests.task_done()
+
+    async def _parse_request(self, identity_frames: list, request_data: bytes) -> dict | None:
+        """Decode a request frame, replying with an error and returning None if it can't be.
+
         Args:
             identity_frames: List of identity frames from ROUTER
             request_data: The actual request data (msgpack or JSON)
         """
+        # Check if request_data is empty or just whitespace
+        if not request_data or not request_data.strip():
+            logger.error(f"Empty request data received. Frames: {len(identity_frames) + 1}")
+            await self._send_error(identity_frames, "Empty request data")
+            return None
+
+        # Try msgpack first (preferred), then fall back to JSON
         try:
-            # Check if request_data is empty or just whitespace
-            if not request_data or not request_data.strip():
-                logger.error(f"Empty request data received. Frames: {len(identity_frames) + 1}")
-                await self._send_error(identity_frames, "Empty request data")
-                return
-            
-            # Try msgpack first (preferred), then fall back to JSON
+            request_dict = msgpack.unpackb(request_data, raw=False)
+            logger.debug("Parsed msgpack request")
+        except Exception:
+            # Try JSON
             try:
-                request_dict = msgpack.unpackb(request_data, raw=False)
-                logger.debug("Parsed msgpack request")
-            except Exception:
-                # Try JSON
-                try:
-                    request_dict = json.loads(request_data.decode('utf-8'))
-                    logger.debug("Parsed JSON request")
-                except json.JSONDecodeError as e:
-                    logger.error(f"Failed to parse request as msgpack or JSON: {e}")
-                    logger.error(f"Request data (first 200 bytes): {request_data[:200]}")
-                    await self._send_error(identity_frames, "Invalid request format (expected msgpack or JSON)")
-                    return
-            
+                # json.loads detects the encoding of bytes input itself
+                request_dict = json.loads(request_data)
+                logger.debug("Parsed JSON request")
+            except (json.JSONDecodeError, UnicodeDecodeError) as e:
+                logger.error(f"Failed to parse request as msgpack or JSON: {e}")
+                logger.error(f"Request data (first 200 bytes): {request_data[:200]}")
+                await self._send_error(identity_frames, "Invalid request format (expected msgpack or JSON)")
+                return None
+
+        if not isinstance(request_dict, dict):
+            await self._send_error(identity_frames, "Request must be a map")
+            return None
+        return request_dict
+
+    async def _handle_request(self, identity_frames: list, request_dict: dict):
+        """Handle a single decoded client request.
+        
+        Args:
+            identity_frames: List of identity frames from ROUTER
+            request_dict: The decoded request
+        """
+        try:
             request_dict.pop("api_key", None)
 
             # Determine request type
@@ -185,11 +261,6 @@ class ZMQServer:
             else:
                 await self._send_error(identity_frames, f"Unknown request type: {request_type}")
                 
-        except json.JSONDecodeError as e:
-            logger.error(f"Invalid JSON in request: {e}")
-            logger.error(f"Request data (first 200 bytes): {request_data[:200]}")
-            logger.error(f"Identity frames count: {len(identity_frames)}, sizes: {[len(f) for f in identity_frames]}")
-            await self._send_error(identity_frames, "Invalid JSON")
         except Exception as e:
             logger.error(f"Error handling request: {e}", exc_info=True)
             await self._send_error(identity_frames, str(e))
@@ -212,16 +283,24 @@ class ZMQServer:
 
         Without a PUB socket: all frames go back to the requesting DEALER via ROUTER only.
         """
+        # Payloads are immutable bytes, so large audio frames can be handed to
+        # libzmq without a copy; pyzmq still copies anything under its
+        # copy_threshold, where a copy is cheaper than tracking the buffer.
         if self.pub_socket is not None:
             if session_id is not None:
-                await self.pub_socket.send_multipart([session_id.encode(), msg_type, data])
+                await self.pub_socket.send_multipart([session_id.encode(), msg_type, data], copy=False)
             else:
-                await self.pub_socket.send_multipart([msg_type, data])
+                await self.pub_socket.send_multipart([msg_type, data], copy=False)
         # metadata and audio are stream-only — no value routing them back to the requester.
         # Everything else (complete, error, response) routes back via ROUTER so that
         # request/response callers (e.g. the network router) receive their reply.
         if self.pub_socket is None or msg_type not in (b"metadata", b"audio"):
-            await self.socket.send_multipart(identity_frames + [msg_type, data])
+            try:
+                await self.socket.send_multipart(identity_frames + [msg_type, data], copy=False)
+            except zmq.ZMQError as e:
+                if e.errno != zmq.EHOSTUNREACH:
+                    raise
+                logger.debug(f"Dropping {msg_type.decode()} frame for disconnected peer")
     
     async def _send_error(self, identity_frames: list, error_msg: str):
         """Send an error message to a client.
@@ -252,6 +331,10 @@ class ZMQServer:
         logger.info("Stopping ZMQ server...")
         self.running = False
 
+        for worker in self._workers:
+            worker.cancel()
+        self._workers = []
+
         await stop_synthesis_queue()
 
         if self._config_sub is not None:
@@ -265,8 +348,9 @@ class ZMQServer:
         if self.pub_socket:
             self.pub_socket.close()
 
-        if self.context:
-            self.context.term()
+        # The context is the process-wide instance and may still be serving
+        # other sockets, so it is left alive rather than terminated
+        self.context = None
 
         logger.info("ZMQ server stopped")
 
@@ -1,16 +1,35 @@
-"""Business logic services for TTS Inference."""
+"""Business logic services for TTS Inference.
 
-from tts.services.tts_service import TTSService
-from tts.services.voice_service import VoiceService
-from tts.services.model_service import ModelService
-from tts.services.database_service import DatabaseService
-from tts.services.synthesis_queue import get_synthesis_queue, stop_synthesis_queue
+Services are imported on first attribute access, so callers that only need
+e.g. DatabaseService don't pull in the TTS engine stack.
+"""
 
-__all__ = [
-    "TTSService",
-    "VoiceService",
-    "ModelService",
-    "DatabaseService",
-    "get_synthesis_queue",
-    "stop_synthesis_queue",
-]
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from tts.services.tts_service import TTSService
+    from tts.services.voice_service import VoiceService
+    from tts.services.model_service import ModelService
+    from tts.services.database_service import DatabaseService
+    from tts.services.synthesis_queue import get_synthesis_queue, stop_synthesis_queue
+
+_EXPORTS = {
+    "TTSService": "tts.services.tts_service",
+    "VoiceService": "tts.services.voice_service",
+    "ModelService": "tts.services.model_service",
+    "DatabaseService": "tts.services.database_service",
+    "get_synthesis_queue": "tts.services.synthesis_queue",
+    "stop_synthesis_queue": "tts.services.synthesis_queue",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name: str):
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
@@ -31,9 +31,11 @@ class DatabaseService:
         """Get current migration status."""
         migrator = get_migrator(self.db_path)
 
-        current_version = migrator.get_current_version()
+        # History is ordered by version, so its last entry is the current
+        # version; no need for a second connection and event loop
         raw_history = migrator.get_migration_history()
         history = [MigrationRecord(v['version'], v['name'], v['applied_at']) for v in raw_history]
+        current_version = history[-1].version if history else 0
 
         return MigrationStatus(
             database_path=str(self.db_path),
@@ -1,6 +1,9 @@
 """TTS synthesis service - shared business logic."""
 
+from collections import OrderedDict
 from pathlib import Path
+import asyncio
+import hashlib
 import logging
 import numpy as np
 
@@ -9,13 +12,46 @@ from tts.tts.voice_manager import VoiceManager
 from tts.models import TTSRequest
 from tts.models.schemas import ChatterboxVoiceConfig, OmniVoiceVoiceConfig, FishSpeechVoiceConfig
 from tts.models.database import VoiceDatabase
-from tts.utils.audio_utils import AudioStreamEncoder
+from tts.utils.audio_utils import AudioStreamEncoder, STREAMING_FORMATS, join_audio_chunks
 from tts.utils.config import CONFIG
 from tts.models.service_dataclasses import TestSamplesResult, TestSamplesFile
 from tts.services.synthesis_queue import get_synthesis_queue
 
 logger = logging.getLogger(__name__)
 
+# Raw PCM carries no framing, so small engine chunks are coalesced up to this
+# size, or for at most this long, before being handed to the transport. The
+# first chunk is always sent on its own to keep time-to-first-audio low.
+# pcm_s8 chunks are self-describing frames and are never merged.
+_PCM_BATCH_BYTES = 16384
+_PCM_BATCH_TIMEOUT = 0.02
+
+# Encoded output of recent REST syntheses, keyed by _audio_cache_key and
+# bounded by CONFIG.audio_cache_size (0 disables it). The ZMQ stream doesn't
+# go through encode_audio_stream and is never cached.
+_audio_cache: OrderedDict[bytes, list[bytes]] = OrderedDict()
+
+
+def _audio_cache_key(
+    request: TTSRequest,
+    voice_reference: np.ndarray | None,
+    voice_transcript: str | None,
+) -> bytes:
+    h = hashlib.blake2b(digest_size=16)
+    for part in (
+        CONFIG.tts_engine,
+        request.text,
+        request.voice_config.model_dump_json(),
+        request.audio_format,
+        str(request.sample_rate),
+        voice_transcript or "",
+    ):
+        h.update(part.encode())
+        h.update(b"\0")
+    if voice_reference is not None:
+        h.update(memoryview(np.ascontiguousarray(voice_reference)).cast("B"))
+    return h.digest()
+
 
 class TTSService:
 
@@ -111,15 +147,56 @@ class TTSService:
         request: TTSRequest,
         voice_reference: np.ndarray | None,
         voice_transcript: str | None = None,
+    ):
+        """Yield encoded audio, replaying a cached take for repeat requests."""
+        max_entries = CONFIG.audio_cache_size
+        if max_entries <= 0:
+            # Disabled: skip building the key, which hashes the whole voice reference
+            async for data in TTSService._encode_audio_stream(request, voice_reference, voice_transcript):
+                yield data
+            return
+
+        key = _audio_cache_key(request, voice_reference, voice_transcript)
+        cached = _audio_cache.get(key)
+        if cached is not None:
+            _audio_cache.move_to_end(key)
+            logger.debug("Audio cache hit")
+            for data in cached:
+                yield data
+            return
+
+        produced = []
+        async for data in TTSService._encode_audio_stream(request, voice_reference, voice_transcript):
+            produced.append(data)
+            yield data
+
+        # Only complete streams reach this point; an aborted one is not cached
+        _audio_cache[key] = produced
+        while len(_audio_cache) > max_entries:
+            _audio_cache.popitem(last=False)
+
+    @staticmethod
+    async def _encode_audio_stream(
+        request: TTSRequest,
+        voice_reference: np.ndarray | None,
+        voice_transcript: str | None = None,
     ):
         output_sr = request.sample_rate or get_tts_engine().sample_rate
         encoder = AudioStreamEncoder(request.audio_format, output_sr)
 
         if request.audio_format == "pcm":
+            async for data in TTSService.batch_pcm(
+                TTSService.synthesize_streaming(request, voice_reference, voice_transcript),
+                encoder,
+            ):
+                yield data
+        elif request.audio_format in STREAMING_FORMATS:
             async for audio_chunk, sample_rate in TTSService.synthesize_streaming(
                 request, voice_reference, voice_transcript
             ):
-                yield encoder.encode_chunk(audio_chunk)
+                encoded_chunk = encoder.encode_chunk(audio_chunk)
+                if encoded_chunk is not None:
+                    yield encoded_chunk
         else:
             async for audio_chunk, sample_rate in TTSService.synthesize_streaming(
                 request, voice_reference, voice_transcript
@@ -130,10 +207,61 @@ class TTSService:
             if encoded_data:
                 yield encoded_data
 
+    @staticmethod
+    async def batch_pcm(chunks, encoder: AudioStreamEncoder):
+        """Coalesce encoded PCM up to _PCM_BATCH_BYTES or _PCM_BATCH_TIMEOUT.
+
+        A single pending __anext__ task is awaited with asyncio.wait, which
+        (unlike wait_for) leaves it running when the flush timeout fires.
+        """
+        loop = asyncio.get_running_loop()
+        chunks = aiter(chunks)
+        pending: asyncio.Future | None = None
+        batch = bytearray()
+        deadline = 0.0
+        sent_first = False
+        try:
+            while True:
+                if pending is None:
+                    pending = asyncio.ensure_future(anext(chunks))
+                timeout = max(0.0, deadline - loop.time()) if batch else None
+                done, _ = await asyncio.wait((pending,), timeout=timeout)
+                if not done:
+                    yield bytes(batch)
+                    batch.clear()
+                    continue
+
+                task, pending = pending, None
+                try:
+                    audio_chunk, _ = task.result()
+                except StopAsyncIteration:
+                    break
+                encoded_chunk = encoder.encode_chunk(audio_chunk)
+                if encoded_chunk is None:
+                    continue
+                if not sent_first or (not batch and len(encoded_chunk) >= _PCM_BATCH_BYTES):
+                    sent_first = True
+                    yield encoded_chunk
+                    continue
+                if not batch:
+                    deadline = loop.time() + _PCM_BATCH_TIMEOUT
+                batch += encoded_chunk
+                if len(batch) >= _PCM_BATCH_BYTES:
+                    yield bytes(batch)
+                    batch.clear()
+            if batch:
+                yield bytes(batch)
+        finally:
+            if pending is not None:
+                pending.cancel()
+                await asyncio.gather(pending, return_exceptions=True)
+            await chunks.aclose()
+
     @staticmethod
     def get_media_type(audio_format: str) -> str:
         media_types = {
             "pcm": "audio/pcm",
+            "pcm_s8": "application/octet-stream",
             "wav": "audio/wav",
             "vorbis": "audio/ogg",
         }
@@ -146,16 +274,16 @@ class TTSService:
         voice_id: str,
         list_available: bool = False,
     ) -> tuple[np.ndarray, str | None]:
-        voice_reference = await voice_manager.load_voice_reference(voice_id)
-        if voice_reference is None:
+        loaded = await voice_manager.load_voice_with_record(voice_id)
+        if loaded is None:
             if list_available:
                 voices = await db.list_voices()
                 available = [v.voice_id for v in voices]
                 raise ValueError(f"Voice not found: {voice_id}. Available: {', '.join(available)}")
             raise ValueError(f"Voice not found: {voice_id}")
 
-        record = await db.get_voice(voice_id)
-        return voice_reference, record.voice_transcript if record else None
+        voice_reference, record = loaded
+        return voice_reference, record.voice_transcript
 
     @staticmethod
     async def generate_test_samples(
@@ -189,14 +317,13 @@ class TTSService:
         async for chunk, sr in get_synthesis_queue().submit(params):
             chunks.append(chunk)
 
-        full_audio = np.concatenate(chunks)
+        full_audio = join_audio_chunks(chunks)
         sample_rate = get_tts_engine().sample_rate
 
-        return TTSService._save_test_samples(chunks, sample_rate, output_path, full_audio)
+        return TTSService._save_test_samples(sample_rate, output_path, full_audio)
 
     @staticmethod
     def _save_test_samples(
-        chunks: list[np.ndarray],
         sample_rate: int,
         output_path: Path,
         full_audio: np.ndarray,
@@ -205,8 +332,9 @@ class TTSService:
         for fmt in ["pcm", "wav", "vorbis"]:
             encoder = AudioStreamEncoder(fmt, sample_rate)
 
-            for chunk in chunks:
-                encoder.encode_chunk(chunk)
+            # The joined audio encodes to the same bytes as the chunk
+            # sequence, so each format takes it as a single chunk
+            encoder.encode_chunk(full_audio)
 
             encoded_data = encoder.finalize()
             if fmt == "pcm":
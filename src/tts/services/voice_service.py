@@ -1,6 +1,9 @@
 """Voice management service - shared business logic."""
 
 import logging
+import time
+from collections import OrderedDict
+
 import numpy as np
 
 from tts.tts import VoiceManager
@@ -9,6 +12,17 @@ from tts.models.service_dataclasses import VoiceRecord
 
 logger = logging.getLogger(__name__)
 
+# Loaded voices are kept briefly (LRU, with a TTL) so back-to-back syntheses
+# with the same voice skip the database lookup and the WAV decode. Reference
+# arrays can be a few MB each, hence the small bound.
+#
+# Only this process's own upload/delete/rename invalidate an entry. Changes
+# made elsewhere (the `tts db` CLI, or the other of the REST and ZMQ servers)
+# can go unseen for up to _VOICE_CACHE_TTL seconds: a deleted or replaced voice
+# may still exist and synthesize from the old reference until it expires.
+_VOICE_CACHE_TTL = 60.0
+_VOICE_CACHE_MAXSIZE = 32
+
 
 class VoiceService:
     """Service for voice management operations."""
@@ -16,15 +30,61 @@ class VoiceService:
     def __init__(self, voice_manager: VoiceManager, db: VoiceDatabase):
         self.voice_manager = voice_manager
         self.db = db
+        self._voice_cache: OrderedDict[str, tuple[float, tuple[np.ndarray, VoiceRecord]]] = OrderedDict()
+        # Bumped on every invalidation so a load that raced a mutation isn't cached
+        self._voice_generation: dict[str, int] = {}
+
+    def _cached_bundle(self, voice_id: str) -> tuple[np.ndarray, VoiceRecord] | None:
+        entry = self._voice_cache.get(voice_id)
+        if entry is None:
+            return None
+        expires_at, bundle = entry
+        if expires_at < time.monotonic():
+            del self._voice_cache[voice_id]
+            return None
+        self._voice_cache.move_to_end(voice_id)
+        return bundle
+
+    def _invalidate(self, *voice_ids: str):
+        for voice_id in voice_ids:
+            self._voice_cache.pop(voice_id, None)
+            self._voice_generation[voice_id] = self._voice_generation.get(voice_id, 0) + 1
+
+    async def get_voice_bundle(self, voice_id: str) -> tuple[np.ndarray, VoiceRecord] | None:
+        """Return (voice_reference, record) for a voice, or None if it can't be loaded.
+
+        The reference array is shared between requests and marked read-only.
+        """
+        bundle = self._cached_bundle(voice_id)
+        if bundle is not None:
+            return bundle
+
+        generation = self._voice_generation.get(voice_id, 0)
+        bundle = await self.voice_manager.load_voice_with_record(voice_id)
+        if bundle is None:
+            return None
+
+        bundle[0].flags.writeable = False
+        if self._voice_generation.get(voice_id, 0) == generation:
+            if len(self._voice_cache) >= _VOICE_CACHE_MAXSIZE:
+                self._voice_cache.popitem(last=False)
+            self._voice_cache[voice_id] = (time.monotonic() + _VOICE_CACHE_TTL, bundle)
+        return bundle
 
     async def load_voice_reference(self, voice_id: str) -> np.ndarray | None:
-        return await self.voice_manager.load_voice_reference(voice_id)
+        bundle = await self.get_voice_bundle(voice_id)
+        return bundle[0] if bundle else None
 
     async def get_voice_transcript(self, voice_id: str) -> str | None:
+        bundle = self._cached_bundle(voice_id)
+        if bundle is not None:
+            return bundle[1].voice_transcript
         record = await self.db.get_voice(voice_id)
         return record.voice_transcript if record else None
 
     async def voice_exists(self, voice_id: str) -> bool:
+        if self._cached_bundle(voice_id) is not None:
+            return True
         return await self.db.voice_exists(voice_id)
 
     async def upload_voice(
@@ -34,18 +94,30 @@ class VoiceService:
         sample_rate: int,
         voice_transcript: str
     ) -> bool:
-        return await self.voice_manager.upload_voice(
-            voice_id=voice_id,
-            audio_file=audio_file,
-            sample_rate=sample_rate,
-            voice_transcript=voice_transcript
-        )
+        self._invalidate(voice_id)
+        try:
+            return await self.voice_manager.upload_voice(
+                voice_id=voice_id,
+                audio_file=audio_file,
+                sample_rate=sample_rate,
+                voice_transcript=voice_transcript
+            )
+        finally:
+            self._invalidate(voice_id)
 
     async def list_voices(self) -> list[VoiceRecord]:
         return await self.db.list_voices()
 
     async def delete_voice(self, voice_id: str) -> bool:
-        return await self.voice_manager.delete_voice(voice_id)
+        self._invalidate(voice_id)
+        try:
+            return await self.voice_manager.delete_voice(voice_id)
+        finally:
+            self._invalidate(voice_id)
 
     async def rename_voice(self, old_voice_id: str, new_voice_id: str) -> bool:
-        return await self.voice_manager.rename_voice(old_voice_id, new_voice_id)
+        self._invalidate(old_voice_id, new_voice_id)
+        try:
+            return await self.voice_manager.rename_voice(old_voice_id, new_voice_id)
+        finally:
+            self._invalidate(old_voice_id, new_voice_id)
@@ -5,6 +5,8 @@ from collections.abc import AsyncIterator
 from typing import ClassVar
 import numpy as np
 
+from tts.utils.audio_utils import join_audio_chunks
+
 
 class BaseTTSEngine(ABC):
     engine_name: ClassVar[str]
@@ -77,5 +79,5 @@ class BaseTTSEngine(ABC):
             output_sr = sr
 
         if chunks:
-            return np.concatenate(chunks), output_sr
+            return join_audio_chunks(chunks), output_sr
         return np.array([]), output_sr
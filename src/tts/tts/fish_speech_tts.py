@@ -205,12 +205,16 @@ class FishSpeechTTSEngine(BaseTTSEngine):
                 continue
 
             _, audio_data = result.audio
+            # Scale straight into a float32 result so int16 PCM is converted
+            # in one pass, without a float64 or extra float32 temporary
             if isinstance(audio_data, bytes):
-                audio_array = np.frombuffer(audio_data, dtype=np.int16).astype(np.float32) / 32768.0
+                audio_array = np.multiply(
+                    np.frombuffer(audio_data, dtype=np.int16), 1.0 / 32768.0, dtype=np.float32
+                )
             else:
                 audio_array = np.asarray(audio_data, dtype=np.float32)
-                if audio_array.dtype != np.float32 or audio_array.max() > 1.0:
-                    audio_array = audio_array.astype(np.float32) / 32768.0
+                if audio_array.max() > 1.0:
+                    audio_array = np.multiply(audio_array, 1.0 / 32768.0, dtype=np.float32)
 
             if audio_array.ndim > 1:
                 audio_array = audio_array.flatten()
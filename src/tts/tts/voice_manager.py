@@ -1,16 +1,31 @@
 """Voice management for TTS cloning."""
 
-import io
 import logging
+import struct
 import wave
 import numpy as np
 from pathlib import Path
 
 from tts.models.database import VoiceDatabase
+from tts.models.service_dataclasses import VoiceRecord
 from tts.utils.config import CONFIG
 
+try:
+    import soundfile as sf
+    SOUNDFILE_AVAILABLE = True
+except ImportError:
+    SOUNDFILE_AVAILABLE = False
+    sf = None
+
 logger = logging.getLogger(__name__)
 
+# Uploads are copied to disk in pieces of this size rather than read whole
+_UPLOAD_CHUNK_SIZE = 1 << 20
+
+# RIFF id, RIFF size, WAVE id, then the fmt chunk id, size, format tag,
+# channel count and sample rate when fmt is the first chunk
+_WAV_HEADER = struct.Struct('<4sI4s4sIHHI')
+
 
 class VoiceManager:
     """Manages voice files and metadata for cloning."""
@@ -31,8 +46,14 @@ class VoiceManager:
         filename = f"{voice_id}.wav"
         return self.voice_dir / filename
 
-    def _read_audio_content(self, audio_file) -> bytes:
-        return audio_file.read()
+    def _write_audio_file(self, audio_file, filepath: Path) -> int | None:
+        chunk = audio_file.read(_UPLOAD_CHUNK_SIZE)
+        header_sr = self._parse_wav_header(chunk)
+        with open(filepath, 'wb') as f:
+            while chunk:
+                f.write(chunk)
+                chunk = audio_file.read(_UPLOAD_CHUNK_SIZE)
+        return header_sr
 
     async def _save_voice_to_db(
         self,
@@ -68,11 +89,14 @@ class VoiceManager:
         filepath = self._generate_voice_path(voice_id)
 
         try:
-            audio_content = self._read_audio_content(audio_file)
-            duration = self._validate_and_get_duration(audio_content)
-
-            with open(filepath, 'wb') as f:
-                f.write(audio_content)
+            header_sr = self._write_audio_file(audio_file, filepath)
+            if header_sr is not None and header_sr != sample_rate:
+                logger.warning(
+                    f"Voice {voice_id}: declared sample_rate {sample_rate} does not match "
+                    f"WAV header {header_sr}; using the header value"
+                )
+                sample_rate = header_sr
+            duration = self._get_wav_duration(filepath)
 
             success = await self._save_voice_to_db(
                 voice_id, filepath, sample_rate, voice_transcript, duration
@@ -152,11 +176,7 @@ class VoiceManager:
             await self._rollback_file_rename(new_filepath, old_filepath)
             return False
     
-    async def _get_voice_filepath(self, voice_id: str):
-        voice_info = await self._get_voice_info(voice_id)
-        if not voice_info:
-            logger.warning(f"Voice not found: {voice_id}")
-            return None
+    def _get_voice_filepath(self, voice_info: VoiceRecord):
         filepath = self.voice_dir / voice_info.filename
         if not filepath.exists():
             logger.error(f"Voice file missing: {filepath}")
@@ -189,38 +209,83 @@ class VoiceManager:
     def _bytes_to_float32(self, audio_bytes: bytes, dtype):
         audio_array = np.frombuffer(audio_bytes, dtype=dtype)
         if dtype == np.uint8:
-            return (audio_array.astype(np.float32) - 128) / 128.0
-        return audio_array.astype(np.float32) / np.iinfo(dtype).max
+            centered = np.subtract(audio_array, 128, dtype=np.float32)
+            centered *= 1.0 / 128.0
+            return centered
+        return np.multiply(audio_array, 1.0 / np.iinfo(dtype).max, dtype=np.float32)
 
     def _to_mono(self, audio_array: np.ndarray, n_channels: int):
         if n_channels > 1:
             return audio_array.reshape(-1, n_channels).mean(axis=1)
         return audio_array
 
+    def _read_audio(self, filepath: Path) -> np.ndarray:
+        """Read a voice file as mono float32.
+
+        libsndfile decodes straight into a float32 buffer when soundfile is
+        installed; the wave module path is kept as the fallback.
+        """
+        if SOUNDFILE_AVAILABLE:
+            try:
+                audio_array, _ = sf.read(str(filepath), dtype='float32', always_2d=False)
+            except sf.LibsndfileError as e:
+                logger.warning(f"soundfile could not read {filepath}, falling back to wave: {e}")
+            else:
+                if audio_array.ndim > 1:
+                    audio_array = audio_array.mean(axis=1, dtype=np.float32)
+                return audio_array
+
+        return self._read_audio_wave(filepath)
+
+    def _read_audio_wave(self, filepath: Path) -> np.ndarray:
+        sample_rate, n_channels, sample_width, n_frames = self._get_wav_params(str(filepath))
+        audio_bytes = self._read_wav_audio(str(filepath), n_frames)
+
+        dtype = self._get_dtype(sample_width)
+        audio_array = self._bytes_to_float32(audio_bytes, dtype)
+        return self._to_mono(audio_array, n_channels)
+
     async def load_voice_reference(self, voice_id: str) -> np.ndarray | None:
-        filepath = await self._get_voice_filepath(voice_id)
+        loaded = await self.load_voice_with_record(voice_id)
+        return loaded[0] if loaded else None
+
+    async def load_voice_with_record(self, voice_id: str) -> tuple[np.ndarray, VoiceRecord] | None:
+        """Load a voice's reference audio together with its database record.
+
+        Callers that also need the transcript get it from the record instead
+        of querying the database a second time.
+        """
+        voice_info = await self._get_voice_info(voice_id)
+        if not voice_info:
+            logger.warning(f"Voice not found: {voice_id}")
+            return None
+
+        filepath = self._get_voice_filepath(voice_info)
         if not filepath:
             return None
 
         try:
-            sample_rate, n_channels, sample_width, n_frames = self._get_wav_params(str(filepath))
-            audio_bytes = self._read_wav_audio(str(filepath), n_frames)
-
-            dtype = self._get_dtype(sample_width)
-            audio_array = self._bytes_to_float32(audio_bytes, dtype)
-            audio_array = self._to_mono(audio_array, n_channels)
-
+            audio_array = self._read_audio(filepath)
             logger.info(f"Loaded voice reference: {voice_id} ({len(audio_array)} samples)")
-            return audio_array
+            return audio_array, voice_info
 
         except Exception as e:
             logger.error(f"Error loading voice reference {voice_id}: {e}")
             return None
     
-    def _validate_and_get_duration(self, audio_content: bytes) -> float:
-        if len(audio_content) < 12 or audio_content[:4] != b'RIFF' or audio_content[8:12] != b'WAVE':
+    def _parse_wav_header(self, header: bytes) -> int | None:
+        """Check the RIFF/WAVE magic and return the sample rate from the fmt chunk.
+
+        Returns None when another chunk (e.g. JUNK) precedes fmt; the file is
+        still accepted and wave reads it properly afterwards.
+        """
+        if len(header) < _WAV_HEADER.size:
+            raise ValueError("Invalid WAV file: missing RIFF/WAVE header")
+        riff_id, _, wave_id, fmt_id, _, _, _, sample_rate = _WAV_HEADER.unpack_from(header)
+        if riff_id != b'RIFF' or wave_id != b'WAVE':
             raise ValueError("Invalid WAV file: missing RIFF/WAVE header")
-        with wave.open(io.BytesIO(audio_content), 'rb') as wav_file:
-            sample_rate = wav_file.getframerate()
-            n_frames = wav_file.getnframes()
-            return n_frames / sample_rate
+        return sample_rate if fmt_id == b'fmt ' else None
+
+    def _get_wav_duration(self, filepath: Path) -> float:
+        sample_rate, _, _, n_frames = self._get_wav_params(str(filepath))
+        return n_frames / sample_rate
@@ -5,12 +5,49 @@ import struct
 import numpy as np
 import subprocess
 import tempfile
+from functools import lru_cache
 from pathlib import Path
-from typing import List
 import logging
 
+try:
+    import soundfile as sf
+    SOUNDFILE_AVAILABLE = True
+except ImportError:
+    SOUNDFILE_AVAILABLE = False
+    sf = None
+
 logger = logging.getLogger(__name__)
 
+_BITS_PER_SAMPLE = 16
+# Formats whose chunks are emitted as they are synthesized
+STREAMING_FORMATS = frozenset({"pcm", "pcm_s8"})
+# Per-chunk prefix for pcm_s8: the float32 dequantization scale
+_PCM_S8_SCALE = struct.Struct('<f')
+# Byte offsets of the RIFF chunk size and data chunk size in a 44-byte header
+_RIFF_SIZE_OFFSET = 4
+_DATA_SIZE_OFFSET = 40
+
+
+def join_audio_chunks(chunks: list[np.ndarray]) -> np.ndarray:
+    """Join audio chunks into one preallocated array.
+    
+    Each list entry is set to None once copied, so chunks the caller no
+    longer references are freed during the join instead of after it.
+    
+    Args:
+        chunks: Non-empty list of 1-D audio chunks (consumed)
+        
+    Returns:
+        The joined audio
+    """
+    out = np.empty(sum(len(chunk) for chunk in chunks), dtype=np.result_type(*chunks))
+    offset = 0
+    for i, chunk in enumerate(chunks):
+        out[offset:offset + len(chunk)] = chunk
+        offset += len(chunk)
+        chunks[i] = None
+    return out
+
 
 def encode_pcm_s16le(audio_array: np.ndarray, sample_rate: int) -> bytes:
     """Encode audio as PCM s16le (signed 16-bit little-endian).
@@ -22,14 +59,79 @@ def encode_pcm_s16le(audio_array: np.ndarray, sample_rate: int) -> bytes:
     Returns:
         PCM encoded bytes
     """
-    # Clip to [-1, 1]
-    audio_array = np.clip(audio_array, -1.0, 1.0)
+    # Convert to int16 and then to bytes
+    return _scale_to_int16_range(audio_array).astype(np.int16).tobytes()
+
+
+def encode_pcm_s16le_into(audio_array: np.ndarray, out: bytearray) -> int:
+    """Encode audio as PCM s16le directly into a caller-owned buffer.
+    
+    Args:
+        audio_array: Audio data as float32 in range [-1, 1]
+        out: Writable buffer of at least 2 * len(audio_array) bytes
+        
+    Returns:
+        Number of bytes written
+    """
+    num_samples = len(audio_array)
+    target = np.frombuffer(out, dtype=np.int16, count=num_samples)
+    np.copyto(target, _scale_to_int16_range(audio_array), casting='unsafe')
+    return 2 * num_samples
+
+
+def encode_pcm_s8(audio_array: np.ndarray, sample_rate: int) -> tuple[bytes, float]:
+    """Encode audio as PCM s8 with a per-buffer dynamic range scale.
     
-    # Convert to int16
-    audio_int16 = (audio_array * 32767).astype(np.int16)
+    Samples are scaled so the buffer's absolute peak maps to 127, then
+    rounded and saturated to int8. Divide by the returned scale to recover
+    the float signal.
     
-    # Convert to bytes
-    return audio_int16.tobytes()
+    Args:
+        audio_array: Audio data as float32 in range [-1, 1]
+        sample_rate: Sample rate (not used for raw PCM, but kept for consistency)
+        
+    Returns:
+        Tuple of (int8 PCM bytes, scale)
+    """
+    peak = float(np.max(np.abs(audio_array))) if len(audio_array) else 0.0
+    scale = 127.0 / (peak or 1.0)
+    
+    quantized = np.multiply(audio_array, scale, dtype=np.float32)
+    np.rint(quantized, out=quantized)
+    np.clip(quantized, -128.0, 127.0, out=quantized)
+    return quantized.astype(np.int8).tobytes(), scale
+
+
+def encode_pcm_s8_frame(audio_array: np.ndarray, sample_rate: int) -> bytes:
+    """Encode audio as a self-describing PCM s8 frame.
+    
+    The frame is a little-endian float32 scale followed by the int8 samples.
+    
+    Args:
+        audio_array: Audio data as float32 in range [-1, 1]
+        sample_rate: Sample rate
+        
+    Returns:
+        Scale prefix plus PCM s8 bytes
+    """
+    pcm_data, scale = encode_pcm_s8(audio_array, sample_rate)
+    return _PCM_S8_SCALE.pack(scale) + pcm_data
+
+
+def _scale_to_int16_range(audio_array: np.ndarray) -> np.ndarray:
+    """Scale float audio to the int16 range, clamped.
+    
+    Args:
+        audio_array: Audio data as float32 in range [-1, 1]
+        
+    Returns:
+        float32 array in [-32767, 32767]
+    """
+    # Scale into a single float32 scratch and clamp it in place, so the clip
+    # doesn't allocate a second full-size copy of the signal
+    scaled = np.multiply(audio_array, 32767.0, dtype=np.float32)
+    np.clip(scaled, -32767.0, 32767.0, out=scaled)
+    return scaled
 
 
 def _encode_riff_header(data_size: int) -> bytes:
@@ -100,12 +202,30 @@ def encode_wav_header(sample_rate: int, num_channels: int, num_samples: int) ->
     Returns:
         WAV header bytes
     """
-    bits_per_sample = 16
-    data_size = num_samples * num_channels * bits_per_sample // 8
+    data_size = num_samples * num_channels * _BITS_PER_SAMPLE // 8
+    
+    # Only the two size fields depend on the audio length, so patch them
+    # into a copy of the cached header for this shape
+    header = bytearray(_wav_header_template(sample_rate, num_channels))
+    struct.pack_into('<I', header, _RIFF_SIZE_OFFSET, 36 + data_size)
+    struct.pack_into('<I', header, _DATA_SIZE_OFFSET, data_size)
+    return bytes(header)
+
+
+@lru_cache(maxsize=8)
+def _wav_header_template(sample_rate: int, num_channels: int) -> bytes:
+    """Build a WAV header with zeroed size fields for a given shape.
     
-    riff_header = _encode_riff_header(data_size)
-    fmt_chunk = _encode_fmt_chunk(sample_rate, num_channels, bits_per_sample)
-    data_header = _encode_data_chunk_header(data_size)
+    Args:
+        sample_rate: Sample rate
+        num_channels: Number of channels
+        
+    Returns:
+        WAV header bytes with data size 0
+    """
+    riff_header = _encode_riff_header(0)
+    fmt_chunk = _encode_fmt_chunk(sample_rate, num_channels, _BITS_PER_SAMPLE)
+    data_header = _encode_data_chunk_header(0)
     
     return riff_header + fmt_chunk + data_header
 
@@ -127,6 +247,46 @@ def encode_wav_complete(audio_array: np.ndarray, sample_rate: int) -> bytes:
 
 
 def encode_vorbis_complete(audio_array: np.ndarray, sample_rate: int, quality: float = 0.4) -> bytes:
+    """Encode complete audio as Ogg Vorbis.
+    
+    Encodes in-process with libsndfile when soundfile is installed and able
+    to write Ogg Vorbis, otherwise falls back to spawning ffmpeg.
+    
+    Args:
+        audio_array: Audio data as float32 in range [-1, 1]
+        sample_rate: Sample rate
+        quality: Encoding quality (0.0 to 1.0)
+        
+    Returns:
+        Vorbis encoded bytes
+    """
+    if not SOUNDFILE_AVAILABLE:
+        return _encode_vorbis_ffmpeg(audio_array, sample_rate, quality)
+    
+    try:
+        buffer = io.BytesIO()
+        # libsndfile's compression level runs the opposite way to vorbis quality
+        sf.write(
+            buffer,
+            audio_array,
+            sample_rate,
+            format='OGG',
+            subtype='VORBIS',
+            compression_level=1.0 - quality,
+        )
+        vorbis_data = buffer.getvalue()
+        
+        logger.info(f"Encoded {len(audio_array)} samples to {len(vorbis_data)} bytes vorbis")
+        return vorbis_data
+        
+    except Exception as e:
+        # e.g. a libsndfile built without Ogg/Vorbis, or an older soundfile
+        # that doesn't accept compression_level
+        logger.warning(f"soundfile vorbis encoding failed, falling back to ffmpeg: {e}")
+        return _encode_vorbis_ffmpeg(audio_array, sample_rate, quality)
+
+
+def _encode_vorbis_ffmpeg(audio_array: np.ndarray, sample_rate: int, quality: float) -> bytes:
     """Encode complete audio as Ogg Vorbis using ffmpeg.
     
     Args:
@@ -165,7 +325,8 @@ def encode_vorbis_complete(audio_array: np.ndarray, sample_rate: int, quality: f
             
             result = subprocess.run(
                 cmd,
-                capture_output=True,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.PIPE,
                 check=True,
                 timeout=30
             )
@@ -201,52 +362,95 @@ class AudioStreamEncoder:
         """Initialize audio stream encoder.
         
         Args:
-            audio_format: "pcm", "wav", or "vorbis"
+            audio_format: "pcm", "pcm_s8", "wav", or "vorbis"
             sample_rate: Sample rate
         """
         self.audio_format = audio_format
         self.sample_rate = sample_rate
-        self._accumulated_chunks: List[np.ndarray] = []
+        # Accumulated float32 samples for vorbis, kept as one contiguous
+        # buffer so finalize can view it without a concatenate pass
+        self._accumulated = bytearray()
+        self._accumulated_samples = 0
+        # WAV chunks are encoded to PCM as they arrive; only the header
+        # has to wait for the total sample count
+        self._pcm_chunks: list[bytes] = []
+        self._total_samples = 0
+        # Reused PCM scratch, grown to the largest chunk seen
+        self._pcm_buf = bytearray()
         
-    def encode_chunk(self, audio_array: np.ndarray) -> bytes:
+    def encode_chunk(self, audio_array: np.ndarray) -> bytes | None:
         """Encode a single audio chunk for streaming.
         
-        For PCM: Returns encoded chunk immediately
-        For WAV/Vorbis: Accumulates chunks (returns empty bytes)
+        For PCM/PCM s8: Returns encoded chunk immediately
+        For WAV/Vorbis: Accumulates chunks (returns None)
         
         Args:
             audio_array: Audio chunk as float32
             
         Returns:
-            Encoded audio bytes (or empty for wav/vorbis during accumulation)
+            Encoded audio bytes, or None when there is nothing to send yet
+            (wav/vorbis accumulation, or an empty chunk)
         """
+        if not len(audio_array):
+            return None
+
         if self.audio_format == "pcm":
             # PCM can be streamed directly
-            return encode_pcm_s16le(audio_array, self.sample_rate)
+            return self._encode_pcm_chunk(audio_array)
+            
+        elif self.audio_format == "pcm_s8":
+            # Each chunk carries its own scale, so it streams like PCM
+            return encode_pcm_s8_frame(audio_array, self.sample_rate)
+            
+        elif self.audio_format == "wav":
+            # WAV needs the total length for its header, so hold the PCM
+            self._pcm_chunks.append(encode_pcm_s16le(audio_array, self.sample_rate))
+            self._total_samples += len(audio_array)
+            return None  # Header and data are emitted at the end
             
         else:
-            # WAV and Vorbis need complete audio, so accumulate
-            self._accumulated_chunks.append(audio_array.copy())
-            return b""  # Return empty, will encode at the end
+            # Vorbis needs complete audio, so accumulate
+            samples = np.ascontiguousarray(audio_array, dtype=np.float32)
+            self._accumulated.extend(memoryview(samples).cast('B'))
+            self._accumulated_samples += len(samples)
+            return None  # Will encode at the end
+    
+    def _encode_pcm_chunk(self, audio_array: np.ndarray) -> bytes:
+        """Encode a PCM chunk through the reusable scratch buffer.
+        
+        Args:
+            audio_array: Audio chunk as float32
+            
+        Returns:
+            PCM encoded bytes (a single copy out of the scratch buffer)
+        """
+        num_bytes = 2 * len(audio_array)
+        if len(self._pcm_buf) < num_bytes:
+            self._pcm_buf = bytearray(num_bytes)
+        encode_pcm_s16le_into(audio_array, self._pcm_buf)
+        return bytes(memoryview(self._pcm_buf)[:num_bytes])
     
     def finalize(self) -> bytes:
         """Finalize encoding and return any remaining data.
         
         For WAV/Vorbis: Encodes all accumulated chunks
-        For PCM: Returns empty bytes
+        For PCM/PCM s8: Returns empty bytes
         
         Returns:
             Final encoded bytes
         """
-        if self._accumulated_chunks:
-            # Concatenate all chunks
-            full_audio = np.concatenate(self._accumulated_chunks)
+        if self._pcm_chunks:
+            logger.info(f"Finalizing wav encoding with {self._total_samples} total samples")
+            header = encode_wav_header(self.sample_rate, 1, self._total_samples)
+            return header + b"".join(self._pcm_chunks)
+        
+        if self._accumulated_samples:
+            # View the accumulated bytes as samples, no copy needed
+            full_audio = np.frombuffer(
+                self._accumulated, dtype=np.float32, count=self._accumulated_samples
+            )
             logger.info(f"Finalizing {self.audio_format} encoding with {len(full_audio)} total samples")
-            
-            if self.audio_format == "wav":
-                return encode_wav_complete(full_audio, self.sample_rate)
-            elif self.audio_format == "vorbis":
-                return encode_vorbis_complete(full_audio, self.sample_rate)
+            return encode_vorbis_complete(full_audio, self.sample_rate)
         
         return b""
     
@@ -261,6 +465,8 @@ class AudioStreamEncoder:
         """
         if self.audio_format == "pcm":
             return encode_pcm_s16le(audio_array, self.sample_rate)
+        elif self.audio_format == "pcm_s8":
+            return encode_pcm_s8_frame(audio_array, self.sample_rate)
         elif self.audio_format == "wav":
             return encode_wav_complete(audio_array, self.sample_rate)
         elif self.audio_format == "vorbis":
@@ -10,6 +10,7 @@ from __future__ import annotations
 
 import logging
 import os
+from functools import cache
 from pathlib import Path
 from typing import Any
 
@@ -43,6 +44,9 @@ def _cfg(key: str, default: Any = None) -> Any:
     return _STORE.get("tts", key, default)
 
 
+_TRUTHY = frozenset({"true", "1", "yes", "on"})
+
+
 class Config:
     """Global configuration for TTS Inference.
 
@@ -51,6 +55,27 @@ class Config:
 
     HOT_KEYS: frozenset[str] = frozenset({"offload_timeout", "keep_warm"})
 
+    __slots__ = (
+        "tts_engine",
+        "voice_dir",
+        "voice_audio_dir",
+        "database_path",
+        "api_key",
+        "default_voice_id",
+        "fastapi_host",
+        "fastapi_port",
+        "zmq_input_address",
+        "zmq_pub_address",
+        "zmq_workers",
+        "log_level",
+        "offload_timeout",
+        "keep_warm",
+        "gpu_device",
+        "fish_speech_checkpoint_path",
+        "fish_speech_decoder_path",
+        "audio_cache_size",
+    )
+
     def __init__(self):
         self.tts_engine = _env("TTS_ENGINE") or _cfg("engine") or "chatterbox"
 
@@ -69,6 +94,12 @@ class Config:
 
         self.zmq_input_address = _env("TTS_INPUT_ADDRESS") or _cfg("input_address") or "tcp://*:20501"
         self.zmq_pub_address = _env("TTS_PUB_ADDRESS") or _cfg("pub_address") or "tcp://*:20502"
+        self.zmq_workers = int(_env("TTS_ZMQ_WORKERS") or _cfg("zmq_workers") or 16)
+        if self.zmq_workers < 1:
+            # With no workers the request queue fills and the server hangs silently
+            raise ValueError(
+                f"TTS_ZMQ_WORKERS (zmq_workers) must be at least 1, got {self.zmq_workers}"
+            )
 
         self.log_level = _env("TTS_LOG_LEVEL", "CHATTERBOX_LOG_LEVEL", "INFO")
 
@@ -84,6 +115,12 @@ class Config:
             default=f"{fish_speech_checkpoint}/codec.pth",
         )
 
+        # Number of encoded REST (/tts/synthesize) syntheses kept for identical
+        # repeat requests. No effect on ZMQ synthesize, which streams straight
+        # from the engine. Off by default: sampling is stochastic, so a hit
+        # replays one take.
+        self.audio_cache_size = int(_env("TTS_AUDIO_CACHE_SIZE") or _cfg("audio_cache_size") or 0)
+
     def reload(self, keys: set[str]) -> None:
         """Re-read hot-reloadable keys from config.toml. Called from the
         ConfigSubscriber when supervisor broadcasts a config_changed event for
@@ -112,7 +149,7 @@ class Config:
     def _read_keep_warm() -> bool:
         env = _env("TTS_KEEP_WARM", "CHATTERBOX_KEEP_WARM")
         if env:
-            return env.lower() in ("true", "1", "yes")
+            return env.lower() in _TRUTHY
         value = _cfg("keep_warm")
         return bool(value) if isinstance(value, bool) else False
 
@@ -129,4 +166,10 @@ class Config:
         return True
 
 
-CONFIG = Config()
+@cache
+def get_config() -> Config:
+    """Return the process-wide Config, built once on first call."""
+    return Config()
+
+
+CONFIG = get_config()
@@ -1,17 +1,32 @@
 import logging
 import sys
 
+_configured_level: int | None = None
+
 
 def setup_logging(log_level: str):
     """Setup logging configuration.
-    
+
+    The handler is installed once per process; later calls only adjust the
+    root level, and only when it differs from the configured one.
+
     Args:
         log_level: Log level (DEBUG, INFO, WARNING, ERROR)
     """
+    global _configured_level
+
+    level = getattr(logging, log_level.upper())
+    if _configured_level is not None:
+        if level != _configured_level:
+            logging.getLogger().setLevel(level)
+            _configured_level = level
+        return
+
     logging.basicConfig(
-        level=getattr(logging, log_level.upper()),
+        level=level,
         format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
         handlers=[
             logging.StreamHandler(sys.stdout)
         ]
     )
+    _configured_level = level